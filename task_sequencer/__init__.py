@@ -10,12 +10,13 @@ progress tracking, and resume capability.
     - ProgressTracker: Абстрактный класс для отслеживания прогресса
     - TaskRegistry: Реестр задач
     - DependencyValidator: Валидатор зависимостей
+    - IncrementalDependencyValidator: Валидатор с поддержкой порядка при добавлении задач
     - ResumeIterator, LimitingIterator: Итераторы для управления потоком элементов
 
 Пример использования:
     >>> from task_sequencer import TaskOrchestrator, TaskRegistry, Task
     >>> from task_sequencer.adapters import MemoryProgressTracker
-    >>> from task_sequencer.validators import DependencyValidator
+    >>> from task_sequencer.validators import DependencyValidator, IncrementalDependencyValidator
     >>>
     >>> class MyTask(Task):
     ...     @property
@@ -34,32 +35,66 @@ progress tracking, and resume capability.
     >>> result = orchestrator.execute(["my_task"])
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.2.0"
-from task_sequencer.core import ExecutionResult, TaskOrchestrator, TaskRegistry
-from task_sequencer.exceptions import (
-    DependencyError,
-    ProgressError,
-    TaskExecutionError,
-)
-from task_sequencer.interfaces import (
-    ExecutionContext,
-    IterableTask,
-    ParameterizedIterableTask,
-    ProgressTracker,
-    Task,
-    TaskMode,
-    TaskResult,
-)
-from task_sequencer.iterators import LimitingIterator, ResumeIterator
-from task_sequencer.logging import get_logger, setup_logging
-from task_sequencer.progress import TaskProgress, TaskStatus
-from task_sequencer.validators import DependencyValidator
+
+if TYPE_CHECKING:
+    from task_sequencer.core import ExecutionResult, TaskOrchestrator, TaskRegistry
+    from task_sequencer.exceptions import (
+        DependencyError,
+        ProgressError,
+        TaskExecutionError,
+    )
+    from task_sequencer.interfaces import (
+        ExecutionContext,
+        IterableTask,
+        ParameterizedIterableTask,
+        ProgressTracker,
+        Task,
+        TaskMode,
+        TaskResult,
+    )
+    from task_sequencer.iterators import LimitingIterator, ResumeIterator
+    from task_sequencer.logging import get_logger, setup_logging
+    from task_sequencer.progress import TaskProgress, TaskStatus
+    from task_sequencer.validators import DependencyValidator, IncrementalDependencyValidator
+
+# Публичные имена загружаются лениво (PEP 562): подмодуль импортируется
+# при первом обращении к имени, после чего значение кэшируется в globals()
+_LAZY_IMPORTS: dict[str, str] = {
+    "TaskOrchestrator": "task_sequencer.core",
+    "TaskRegistry": "task_sequencer.core",
+    "ExecutionResult": "task_sequencer.core",
+    "DependencyValidator": "task_sequencer.validators",
+    "IncrementalDependencyValidator": "task_sequencer.validators",
+    "ResumeIterator": "task_sequencer.iterators",
+    "LimitingIterator": "task_sequencer.iterators",
+    "Task": "task_sequencer.interfaces",
+    "IterableTask": "task_sequencer.interfaces",
+    "ParameterizedIterableTask": "task_sequencer.interfaces",
+    "ProgressTracker": "task_sequencer.interfaces",
+    "TaskResult": "task_sequencer.interfaces",
+    "TaskMode": "task_sequencer.interfaces",
+    "ExecutionContext": "task_sequencer.interfaces",
+    "TaskProgress": "task_sequencer.progress",
+    "TaskStatus": "task_sequencer.progress",
+    "DependencyError": "task_sequencer.exceptions",
+    "TaskExecutionError": "task_sequencer.exceptions",
+    "ProgressError": "task_sequencer.exceptions",
+    "get_logger": "task_sequencer.logging",
+    "setup_logging": "task_sequencer.logging",
+}
 
 __all__ = [
     "TaskOrchestrator",
     "TaskRegistry",
     "ExecutionResult",
     "DependencyValidator",
+    "IncrementalDependencyValidator",
     "ResumeIterator",
     "LimitingIterator",
     "Task",
@@ -78,6 +113,33 @@ __all__ = [
     "setup_logging",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Загружает публичное имя из подмодуля при первом обращении.
+
+    Args:
+        name: Имя атрибута пакета
+
+    Returns:
+        Объект из соответствующего подмодуля
+
+    Raises:
+        AttributeError: Если имя не входит в публичный API пакета
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Кэшируем, чтобы следующие обращения не доходили до __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Возвращает атрибуты пакета вместе с еще не загруженными публичными именами."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 # Адаптеры импортируются напрямую из task_sequencer.adapters
 # Например: from task_sequencer.adapters import MemoryProgressTracker
 
@@ -0,0 +1,34 @@
+"""Разбор строк подключения для адаптеров трекеров прогресса.
+
+Модуль не зависит от драйверов БД, поэтому его можно импортировать
+без установленных опциональных зависимостей.
+"""
+
+from __future__ import annotations
+
+from urllib.parse import urlparse
+
+
+def extract_database_name(connection_string: str) -> str | None:
+    """Извлекает имя базы данных из connection string.
+
+    Args:
+        connection_string: Строка подключения вида
+            `scheme://[username:password@]host[:port][/database][?options]`
+
+    Returns:
+        Имя базы данных или None, если не найдено
+
+    Пример использования:
+        >>> extract_database_name("mongodb://host:27017/my_db?replicaSet=rs0")
+        'my_db'
+    """
+    try:
+        parsed = urlparse(connection_string)
+    except ValueError:
+        # Если не удалось разобрать, возвращаем None
+        return None
+
+    # Путь после слэша содержит имя БД, параметры запроса urlparse отделяет сам
+    db_name = parsed.path.lstrip("/")
+    return db_name or None
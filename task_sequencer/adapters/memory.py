@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
+from contextlib import nullcontext
 from datetime import datetime
-from typing import ContextManager
+from typing import Callable, ContextManager
 
 from task_sequencer.exceptions import ProgressError
 from task_sequencer.interfaces import ProgressTracker
 from task_sequencer.progress import TaskProgress, TaskStatus
 
+# Словарь в памяти не требует транзакций; nullcontext без состояния
+# безопасно переиспользовать, в том числе во вложенных транзакциях
+_NO_TRANSACTION: ContextManager[None] = nullcontext()
+
 
 class MemoryProgressTracker(ProgressTracker):
     """Трекер прогресса, хранящий данные в памяти.
@@ -51,6 +55,20 @@ class MemoryProgressTracker(ProgressTracker):
         except Exception as e:
             raise ProgressError(f"Failed to save progress: {e}") from e
 
+    def _progress_writer(self) -> Callable[[str, TaskProgress], None]:
+        """Возвращает функцию записи прогресса для ResumeIterator.
+
+        ResumeIterator сам создает TaskProgress с согласованным именем задачи,
+        поэтому проверки save_progress ему не нужны: если save_progress не
+        переопределен в подклассе, запись идет напрямую в словарь.
+
+        Returns:
+            Функция (имя задачи, прогресс) -> None
+        """
+        if type(self).save_progress is MemoryProgressTracker.save_progress:
+            return self._storage.__setitem__
+        return self.save_progress
+
     def get_progress(self, task_name: str) -> TaskProgress | None:
         """Получает сохраненный прогресс выполнения задачи.
 
@@ -123,12 +141,15 @@ class MemoryProgressTracker(ProgressTracker):
         except Exception as e:
             raise ProgressError(f"Failed to clear progress: {e}") from e
 
-    @contextmanager
     def transaction(self) -> ContextManager[None]:
         """Заглушка для MemoryProgressTracker (не требует транзакций).
 
+        Возвращает один и тот же переиспользуемый nullcontext, поэтому
+        частые транзакции (оркестратор открывает их на каждую задачу)
+        не создают генератор и контекстный менеджер при каждом вызове.
+
         Returns:
             Контекстный менеджер (заглушка)
         """
-        yield
+        return _NO_TRANSACTION
 
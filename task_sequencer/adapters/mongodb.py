@@ -16,6 +16,7 @@ except ImportError as e:
         "Install it with: pip install task-sequencer[mongodb]"
     ) from e
 
+from task_sequencer.adapters._connection import extract_database_name
 from task_sequencer.exceptions import ProgressError
 from task_sequencer.interfaces import ProgressTracker
 from task_sequencer.progress import TaskProgress, TaskStatus
@@ -107,26 +108,7 @@ class MongoDBProgressTracker(ProgressTracker):
         Returns:
             Имя базы данных или None, если не найдено
         """
-        # Формат: mongodb://[username:password@]host[:port][/database]
-        # Ищем последний слэш после порта
-        try:
-            # Разбираем URL
-            from urllib.parse import urlparse
-
-            parsed = urlparse(connection_string)
-            # Путь после слэша содержит имя БД
-            if parsed.path and len(parsed.path) > 1:
-                # Убираем ведущий слэш
-                db_name = parsed.path.lstrip("/")
-                # Убираем параметры запроса, если есть
-                if "?" in db_name:
-                    db_name = db_name.split("?")[0]
-                if db_name:
-                    return db_name
-        except Exception:
-            # Если не удалось разобрать, возвращаем None
-            pass
-        return None
+        return extract_database_name(connection_string)
 
     def save_progress(
         self, task_name: str, progress: TaskProgress
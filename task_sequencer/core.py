@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import logging
+import sys
+import threading
+from collections.abc import Sized
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Iterator
 
 from task_sequencer.exceptions import DependencyError, TaskExecutionError
 from task_sequencer.interfaces import (
@@ -22,6 +29,20 @@ if TYPE_CHECKING:
     from task_sequencer.validators import DependencyValidator
 
 
+def _default_id_extractor(item: Any) -> str:
+    """Извлекает ID элемента для resume по умолчанию.
+
+    Args:
+        item: Элемент итеративной задачи
+
+    Returns:
+        Значение ключа "id" для dict с этим ключом, иначе str(item)
+    """
+    if isinstance(item, dict) and "id" in item:
+        return str(item["id"])
+    return str(item)
+
+
 class TaskRegistry:
     """Реестр задач для управления и доступа к задачам.
 
@@ -57,6 +78,8 @@ class TaskRegistry:
 
     Attributes:
         _tasks: Словарь задач (имя задачи -> Task)
+        _deps: Кэш зависимостей задач (имя задачи -> кортеж имен)
+        _version: Счетчик изменений реестра (увеличивается при каждой регистрации)
     """
 
     def __init__(self, tasks: list[Task] | None = None) -> None:
@@ -69,6 +92,8 @@ class TaskRegistry:
             ValueError: Если в списке tasks есть задачи с дублирующимися именами
         """
         self._tasks: dict[str, Task] = {}
+        self._deps: dict[str, tuple[str, ...]] = {}
+        self._version = 0
         if tasks:
             for task in tasks:
                 self.register(task)
@@ -82,9 +107,12 @@ class TaskRegistry:
         Raises:
             ValueError: Если задача с таким именем уже зарегистрирована
         """
-        task_name = task.name
+        # Интернируем имя: ключи реестра совпадают по identity с интернированными
+        # именами в task_order, и поиск в словаре не сравнивает строки посимвольно
+        task_name = sys.intern(task.name)
         self._check_unique_name(task_name)
         self._tasks[task_name] = task
+        self._version += 1
 
     def get(self, task_name: str) -> Task:
         """Получает задачу по имени.
@@ -107,9 +135,34 @@ class TaskRegistry:
             ... except KeyError:
             ...     print("Task not found")
         """
-        if task_name not in self._tasks:
+        # Один поиск в словаре вместо проверки `in` и последующего []
+        task = self._tasks.get(task_name)
+        if task is None:
             raise KeyError(f"Task '{task_name}' not found in registry")
-        return self._tasks[task_name]
+        return task
+
+    def deps_of(self, task_name: str) -> tuple[str, ...]:
+        """Получает зависимости задачи без обращения к свойству depends_on.
+
+        Зависимости запоминаются при первом обращении, поэтому повторные
+        проверки (например, в DependencyValidator) не вызывают depends_on
+        и не создают новый список. Имена зависимостей интернируются, чтобы
+        поиск по ключам реестра совпадал по identity.
+
+        Args:
+            task_name: Имя задачи
+
+        Returns:
+            Кортеж имен задач-зависимостей
+
+        Raises:
+            KeyError: Если задача с указанным именем не найдена
+        """
+        deps = self._deps.get(task_name)
+        if deps is None:
+            deps = tuple(map(sys.intern, self.get(task_name).depends_on))
+            self._deps[task_name] = deps
+        return deps
 
     def get_all(self) -> list[Task]:
         """Получает все зарегистрированные задачи.
@@ -213,6 +266,85 @@ class ExecutionResult:
     failed_tasks: list[str]
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def empty(cls, mode: TaskMode = "run", resume: bool = False) -> ExecutionResult:
+        """Создает результат выполнения пустой последовательности задач.
+
+        Каждый вызов возвращает новый экземпляр: списки и словари результата
+        изменяемые, общий экземпляр мог бы быть испорчен вызывающим кодом.
+
+        Args:
+            mode: Режим выполнения
+            resume: Флаг восстановления с места остановки
+
+        Returns:
+            ExecutionResult со статусом COMPLETED без задач
+        """
+        return cls(
+            status=TaskStatus.COMPLETED,
+            results={},
+            completed_tasks=[],
+            failed_tasks=[],
+            metadata={
+                "mode": mode,
+                "resume": resume,
+                "phase_times_ns": {"validate": 0, "execute": 0},
+            },
+        )
+
+
+class _SerializedProgressTracker(ProgressTracker):
+    """Обертка, сериализующая обращения к трекеру из нескольких потоков.
+
+    Используется оркестратором при max_workers > 1: итеративные задачи
+    читают и сохраняют прогресс в рабочих потоках, а трекеры БД хранят
+    состояние транзакции в общем атрибуте экземпляра. Каждый вызов
+    выполняется под общей блокировкой, а transaction() держит ее на весь
+    блок, поэтому запись из другого потока не попадет в чужую транзакцию.
+    Блокировка реентерабельная: вызовы внутри transaction() в том же
+    потоке не блокируются.
+
+    Attributes:
+        tracker: Исходный трекер прогресса
+        _lock: Блокировка доступа к трекеру
+    """
+
+    def __init__(self, tracker: ProgressTracker) -> None:
+        """Инициализирует обертку.
+
+        Args:
+            tracker: Исходный трекер прогресса
+        """
+        self.tracker = tracker
+        self.supports_persistence = tracker.supports_persistence
+        self._lock = threading.RLock()
+
+    def save_progress(self, task_name: str, progress: TaskProgress) -> None:
+        """Сохраняет прогресс под блокировкой."""
+        with self._lock:
+            self.tracker.save_progress(task_name, progress)
+
+    def get_progress(self, task_name: str) -> TaskProgress | None:
+        """Получает прогресс под блокировкой."""
+        with self._lock:
+            return self.tracker.get_progress(task_name)
+
+    def mark_completed(self, task_name: str) -> None:
+        """Отмечает задачу завершенной под блокировкой."""
+        with self._lock:
+            self.tracker.mark_completed(task_name)
+
+    def clear_progress(self, task_name: str) -> None:
+        """Очищает прогресс под блокировкой."""
+        with self._lock:
+            self.tracker.clear_progress(task_name)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Открывает транзакцию трекера, удерживая блокировку до ее конца."""
+        with self._lock, self.tracker.transaction():
+            yield
+
 
 class TaskOrchestrator:
     """Оркестратор для управления последовательным выполнением задач.
@@ -247,6 +379,10 @@ class TaskOrchestrator:
         task_registry: Реестр задач
         progress_tracker: Трекер прогресса
         dependency_validator: Валидатор зависимостей
+        max_workers: Число потоков для параллельного выполнения (None - последовательно)
+        _tracker: Трекер, через который идут все обращения к прогрессу; при
+            max_workers > 1 - обертка, сериализующая вызовы из разных потоков
+        _plan: Последний построенный граф зависимостей для параллельного выполнения
     """
 
     def __init__(
@@ -254,6 +390,7 @@ class TaskOrchestrator:
         task_registry: TaskRegistry,
         progress_tracker: ProgressTracker,
         dependency_validator: DependencyValidator,
+        max_workers: int | None = None,
     ) -> None:
         """Инициализирует оркестратор задач.
 
@@ -261,10 +398,25 @@ class TaskOrchestrator:
             task_registry: Реестр задач
             progress_tracker: Трекер прогресса
             dependency_validator: Валидатор зависимостей
+            max_workers: Число потоков для параллельного выполнения независимых
+                задач. None или 1 - последовательное выполнение в порядке
+                task_order. Трекер при этом может не быть потокобезопасным:
+                оркестратор сериализует обращения к нему
         """
         self.task_registry = task_registry
         self.progress_tracker = progress_tracker
         self.dependency_validator = dependency_validator
+        self.max_workers = max_workers
+        self._tracker: ProgressTracker = (
+            _SerializedProgressTracker(progress_tracker)
+            if max_workers is not None and max_workers > 1
+            else progress_tracker
+        )
+        # (версия реестра, task_order) -> граф для параллельного выполнения
+        self._plan: (
+            tuple[tuple[int, tuple[str, ...]], dict[str, list[str]], dict[str, int]]
+            | None
+        ) = None
 
     def execute(
         self,
@@ -280,97 +432,77 @@ class TaskOrchestrator:
             resume: Флаг восстановления с места остановки
 
         Returns:
-            ExecutionResult с результатами выполнения задач
+            ExecutionResult с результатами выполнения задач. В metadata
+            phase_times_ns содержит длительность фаз в наносекундах
+            (perf_counter_ns): "validate" - валидация зависимостей,
+            "execute" - выполнение задач вместе с сохранением прогресса
 
         Raises:
             DependencyError: Если нарушены зависимости задач
             TaskExecutionError: Если произошла ошибка при выполнении задачи
         """
+        # Пустой порядок: выполнять нечего, валидация и контекст не нужны
+        if not task_order:
+            return ExecutionResult.empty(mode, resume)
+
         # Валидация зависимостей
+        started_ns = perf_counter_ns()
         self._validate_dependencies(task_order)
+        validated_ns = perf_counter_ns()
 
-        # Инициализация контекста выполнения
+        # Инициализация контекста выполнения; словарь результатов общий для
+        # контекста и ExecutionResult, задачи видят его без копирования
+        results: dict[str, TaskResult] = {}
         context = ExecutionContext(
             task_order=task_order,
-            results={},
+            results=results,
             metadata={},
-            progress_tracker=self.progress_tracker,
+            progress_tracker=self._tracker,
             mode=mode,
         )
 
         logger = get_logger()
         logger.info(
-            f"Starting execution of {len(task_order)} tasks",
+            "Starting execution of %d tasks",
+            len(task_order),
             extra={"mode": mode, "resume": resume, "task_order": task_order},
         )
 
         completed_tasks: list[str] = []
-        completed_set: set[str] = set()
-        results: dict[str, TaskResult] = {}
-
-        # Выполнение задач в указанном порядке
-        for task_name in task_order:
-            # Проверка удовлетворенности зависимостей
-            task = self.task_registry.get(task_name)
-            if not self._check_dependencies_satisfied(task, completed_set):
-                raise DependencyError(
-                    f"Task '{task_name}' dependencies not satisfied"
-                )
 
-            # Выполнение задачи
-            try:
-                # Сохранение прогресса: начало выполнения (только если задача еще не начата)
-                existing_progress = self.progress_tracker.get_progress(task_name)
-                if existing_progress is None or existing_progress.status != TaskStatus.IN_PROGRESS:
-                    self._mark_task_started(task_name)
-
-                # Для IterableTask с resume нужно установить id_extractor в metadata
-                if isinstance(task, IterableTask) and resume:
-                    # Пытаемся использовать id_extractor из metadata, если есть
-                    if "id_extractor" not in context.metadata:
-                        # Используем функцию по умолчанию, которая работает с dict
-                        def default_id_extractor(item: Any) -> str:
-                            if isinstance(item, dict) and "id" in item:
-                                return str(item["id"])
-                            return str(item)
-
-                        context.metadata["id_extractor"] = default_id_extractor
-                    # Устанавливаем флаг resume в metadata для IterableTask
-                    context.metadata["resume"] = True
-
-                # Выполнение задачи
-                if isinstance(task, IterableTask):
-                    result = self._execute_iterable_task(task, context)
-                else:
-                    result = self._execute_task(task, context)
-
-                results[task_name] = result
-                context.results[task_name] = result
-
-                if result.success:
-                    completed_tasks.append(task_name)
-                    completed_set.add(task_name)
-                    with self.progress_tracker.transaction():
-                        self.progress_tracker.mark_completed(task_name)
-                else:
+        if self.max_workers is not None and self.max_workers > 1:
+            self._schedule_dag(task_order, context, resume, results, completed_tasks)
+        else:
+            completed_set: set[str] = set()
+
+            # Выполнение задач в указанном порядке
+            for task_name in task_order:
+                # Проверка удовлетворенности зависимостей
+                task = self.task_registry.get(task_name)
+                if not self._check_dependencies_satisfied(task, completed_set):
+                    raise DependencyError(
+                        f"Task '{task_name}' dependencies not satisfied"
+                    )
+
+                self._prepare_task(task, context, resume)
+                result = self._run_task(task, context)
+                if not self._record_result(
+                    task_name, result, results, completed_tasks
+                ):
                     # Задача провалилась - прерываем выполнение
-                    self._mark_task_failed(task_name, result.error or "Unknown error")
                     break
-
-            except TaskExecutionError as e:
-                # Ошибка выполнения задачи
-                error_result = TaskResult.failure_result(
-                    error=str(e), metadata={"task_name": task_name}
-                )
-                results[task_name] = error_result
-                context.results[task_name] = error_result
-                self._mark_task_failed(task_name, str(e))
-                break
-
-        # Формирование результата
-        failed_tasks = [
-            name for name, result in results.items() if not result.success
-        ]
+                completed_set.add(task_name)
+
+        executed_ns = perf_counter_ns()
+
+        # Формирование результата; каждый результат либо успешен, либо нет,
+        # поэтому при совпадении счетчиков проход по results не нужен
+        if len(completed_tasks) == len(results):
+            failed_tasks: list[str] = []
+        else:
+            failed_tasks = [
+                name for name, result in results.items() if not result.success
+            ]
         final_status = (
             TaskStatus.COMPLETED
             if len(completed_tasks) == len(task_order)
@@ -382,9 +514,185 @@ class TaskOrchestrator:
             results=results,
             completed_tasks=completed_tasks,
             failed_tasks=failed_tasks,
-            metadata={"mode": mode, "resume": resume},
+            metadata={
+                "mode": mode,
+                "resume": resume,
+                "phase_times_ns": {
+                    "validate": validated_ns - started_ns,
+                    "execute": executed_ns - validated_ns,
+                },
+            },
         )
 
+    def _schedule_dag(
+        self,
+        task_order: list[str],
+        context: ExecutionContext,
+        resume: bool,
+        results: dict[str, TaskResult],
+        completed_tasks: list[str],
+    ) -> None:
+        """Выполняет задачи параллельно по графу зависимостей.
+
+        Для каждой задачи считается число невыполненных зависимостей
+        (in-degree); задачи без зависимостей сразу отправляются в
+        ThreadPoolExecutor, а после завершения задачи ее потомки с нулевым
+        in-degree отправляются следом. Граф берется из _dag_plan и
+        перестраивается только при смене task_order или версии реестра.
+
+        Начало и завершение задачи отмечаются в вызывающем потоке, а
+        _run_task выполняется в рабочем: там итеративная задача читает
+        прогресс для лога, а ResumeIterator внутри task.execute сохраняет его.
+        Поэтому все обращения к трекеру идут через _tracker, сериализующий
+        вызовы. После первой неудачной задачи новые задачи не запускаются,
+        уже запущенные дожидаются завершения.
+
+        Args:
+            task_order: Список задач (порядок задает очередность запуска
+                независимых задач)
+            context: Контекст выполнения
+            resume: Флаг восстановления с места остановки
+            results: Словарь для результатов выполнения (заполняется)
+            completed_tasks: Список для имен выполненных задач (заполняется)
+        """
+        children, initial_in_degree = self._dag_plan(task_order)
+        in_degree = initial_in_degree.copy()
+
+        failed = False
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending: dict[Future[TaskResult], str] = {}
+
+            def submit(task_name: str) -> None:
+                task = self.task_registry.get(task_name)
+                self._prepare_task(task, context, resume)
+                pending[executor.submit(self._run_task, task, context)] = task_name
+
+            for task_name in task_order:
+                if in_degree[task_name] == 0:
+                    submit(task_name)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task_name = pending.pop(future)
+                    if not self._record_result(
+                        task_name, future.result(), results, completed_tasks
+                    ):
+                        failed = True
+                    if failed:
+                        continue
+                    for child in children[task_name]:
+                        in_degree[child] -= 1
+                        if in_degree[child] == 0:
+                            submit(child)
+
+    def _dag_plan(
+        self, task_order: list[str]
+    ) -> tuple[dict[str, list[str]], dict[str, int]]:
+        """Возвращает граф зависимостей для task_order, запоминая последний.
+
+        Повторный execute того же порядка на неизменном реестре не
+        перестраивает список смежности. Возвращаемые структуры общие
+        для вызовов: in-degree нужно копировать перед изменением.
+
+        Args:
+            task_order: Список задач
+
+        Returns:
+            Кортеж (задача -> зависимые задачи, задача -> число зависимостей)
+        """
+        plan_key = (self.task_registry._version, tuple(task_order))
+        plan = self._plan
+        if plan is not None and plan[0] == plan_key:
+            return plan[1], plan[2]
+
+        in_degree: dict[str, int] = {}
+        children: dict[str, list[str]] = {name: [] for name in task_order}
+        for task_name in task_order:
+            deps = self.task_registry.deps_of(task_name)
+            in_degree[task_name] = len(deps)
+            for dep in deps:
+                children[dep].append(task_name)
+
+        self._plan = (plan_key, children, in_degree)
+        return children, in_degree
+
+    def _prepare_task(
+        self, task: Task, context: ExecutionContext, resume: bool
+    ) -> None:
+        """Отмечает начало задачи и готовит контекст перед ее выполнением.
+
+        Args:
+            task: Задача для выполнения
+            context: Контекст выполнения
+            resume: Флаг восстановления с места остановки
+        """
+        # name может быть вычисляемым свойством, поэтому читается один раз
+        task_name = task.name
+
+        # Сохранение прогресса: начало выполнения (только если задача еще не начата)
+        existing_progress = self._tracker.get_progress(task_name)
+        if existing_progress is None or existing_progress.status != TaskStatus.IN_PROGRESS:
+            self._mark_task_started(task_name)
+
+        # Для IterableTask с resume нужно установить id_extractor в metadata
+        if isinstance(task, IterableTask) and resume:
+            # Пытаемся использовать id_extractor из metadata, если есть
+            if "id_extractor" not in context.metadata:
+                # Используем функцию по умолчанию, которая работает с dict
+                context.metadata["id_extractor"] = _default_id_extractor
+            # Устанавливаем флаг resume в metadata для IterableTask
+            context.metadata["resume"] = True
+
+    def _run_task(self, task: Task, context: ExecutionContext) -> TaskResult:
+        """Выполняет задачу, преобразуя TaskExecutionError в неуспешный результат.
+
+        Args:
+            task: Задача для выполнения
+            context: Контекст выполнения
+
+        Returns:
+            TaskResult с результатом выполнения
+        """
+        try:
+            if isinstance(task, IterableTask):
+                return self._execute_iterable_task(task, context)
+            return self._execute_task(task, context)
+        except TaskExecutionError as e:
+            # Ошибка выполнения задачи
+            return TaskResult.failure_result(
+                error=str(e), metadata={"task_name": task.name}
+            )
+
+    def _record_result(
+        self,
+        task_name: str,
+        result: TaskResult,
+        results: dict[str, TaskResult],
+        completed_tasks: list[str],
+    ) -> bool:
+        """Сохраняет результат задачи и отмечает ее завершение в трекере.
+
+        Args:
+            task_name: Имя задачи
+            result: Результат выполнения задачи
+            results: Словарь результатов выполнения
+            completed_tasks: Список имен выполненных задач
+
+        Returns:
+            True если задача выполнена успешно, False иначе
+        """
+        results[task_name] = result
+
+        if result.success:
+            completed_tasks.append(task_name)
+            with self._tracker.transaction():
+                self._tracker.mark_completed(task_name)
+            return True
+
+        self._mark_task_failed(task_name, result.error or "Unknown error")
+        return False
+
     def _validate_dependencies(self, task_order: list[str]) -> None:
         """Валидирует зависимости между задачами.
 
@@ -408,7 +716,7 @@ class TaskOrchestrator:
         Returns:
             True если все зависимости выполнены, False иначе
         """
-        return all(dep in completed for dep in task.depends_on)
+        return task.depends_on_set <= completed
 
     def _execute_task(
         self, task: Task, context: ExecutionContext
@@ -425,24 +733,27 @@ class TaskOrchestrator:
         Raises:
             TaskExecutionError: Если произошла ошибка при выполнении
         """
-        logger = get_logger(task.name)
+        task_name = task.name
+        logger = get_logger(task_name)
         logger.debug("Executing task")
 
         try:
             result = task.execute(context)
-            logger.info(
-                "Task completed successfully",
-                extra={
-                    "success": result.success,
-                    "status": result.status.value,
-                },
-            )
+            # Словарь extra строится на каждую задачу, поэтому только при включенном INFO
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Task completed successfully",
+                    extra={
+                        "success": result.success,
+                        "status": result.status.value,
+                    },
+                )
             return result
         except Exception as e:
-            logger.error(f"Task execution failed: {e}", exc_info=True)
+            logger.error("Task execution failed: %s", e, exc_info=True)
             raise TaskExecutionError(
-                f"Error executing task '{task.name}': {e}",
-                task_name=task.name,
+                f"Error executing task '{task_name}': {e}",
+                task_name=task_name,
             ) from e
 
     def _execute_iterable_task(
@@ -460,32 +771,41 @@ class TaskOrchestrator:
         Raises:
             TaskExecutionError: Если произошла ошибка при выполнении
         """
-        logger = get_logger(task.name)
+        task_name = task.name
+        logger = get_logger(task_name)
         logger.debug("Executing iterable task")
 
         try:
-            # Получаем элементы для обработки
-            items = list(task.get_items(context))
-            total = len(items)
+            # Получаем элементы для обработки; коллекцию с известной длиной
+            # не копируем, итератор приходится материализовать для подсчета
+            items = task.get_items(context)
+            total = len(items) if isinstance(items, Sized) else len(list(items))
 
             if total == 0:
                 logger.info("No items to process")
                 return TaskResult.success_result()
 
             logger.info(
-                f"Processing {total} items",
+                "Processing %d items",
+                total,
                 extra={"total_items": total},
             )
 
             # Выполняем задачу (она сама обрабатывает элементы)
             result = task.execute(context)
 
-            # Логируем прогресс из сохраненного прогресса, если доступен
-            progress = self.progress_tracker.get_progress(task.name)
+            # Логируем прогресс из сохраненного прогресса, если доступен;
+            # прогресс читается из трекера только ради лога
+            if not logger.isEnabledFor(logging.INFO):
+                return result
+
+            progress = self._tracker.get_progress(task_name)
             if progress:
                 processed = progress.processed_items or 0
                 logger.info(
-                    f"Task completed: {processed}/{total} items processed",
+                    "Task completed: %d/%d items processed",
+                    processed,
+                    total,
                     extra={
                         "processed_items": processed,
                         "total_items": total,
@@ -504,10 +824,10 @@ class TaskOrchestrator:
 
             return result
         except Exception as e:
-            logger.error(f"Iterable task execution failed: {e}", exc_info=True)
+            logger.error("Iterable task execution failed: %s", e, exc_info=True)
             raise TaskExecutionError(
-                f"Error executing iterable task '{task.name}': {e}",
-                task_name=task.name,
+                f"Error executing iterable task '{task_name}': {e}",
+                task_name=task_name,
             ) from e
 
 
@@ -517,13 +837,13 @@ class TaskOrchestrator:
         Args:
             task_name: Имя задачи
         """
-        with self.progress_tracker.transaction():
+        with self._tracker.transaction():
             progress = TaskProgress(
                 task_name=task_name,
                 status=TaskStatus.IN_PROGRESS,
                 started_at=datetime.now(),
             )
-            self.progress_tracker.save_progress(task_name, progress)
+            self._tracker.save_progress(task_name, progress)
 
     def _mark_task_failed(self, task_name: str, error_message: str) -> None:
         """Отмечает задачу как провалившуюся.
@@ -532,12 +852,12 @@ class TaskOrchestrator:
             task_name: Имя задачи
             error_message: Сообщение об ошибке
         """
-        with self.progress_tracker.transaction():
+        with self._tracker.transaction():
             progress = TaskProgress(
                 task_name=task_name,
                 status=TaskStatus.FAILED,
                 error_message=error_message,
                 completed_at=datetime.now(),
             )
-            self.progress_tracker.save_progress(task_name, progress)
+            self._tracker.save_progress(task_name, progress)
 
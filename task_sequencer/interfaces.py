@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, ContextManager, Generic, Iterator, Literal, TypeVar
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Generic,
+    Iterable,
+    Iterator,
+    Literal,
+    TypeVar,
+)
 
 from task_sequencer.progress import TaskProgress, TaskStatus
 from task_sequencer.types import ProgressTrackerProtocol
@@ -37,7 +48,8 @@ class TaskResult:
         Returns:
             True, если статус COMPLETED, иначе False
         """
-        return self.status == TaskStatus.COMPLETED
+        # Члены Enum - синглтоны: сравнение по identity без вызова Enum.__eq__
+        return self.status is TaskStatus.COMPLETED
 
     @classmethod
     def success_result(
@@ -143,6 +155,20 @@ class Task(ABC):
         """
         ...
 
+    @cached_property
+    def depends_on_set(self) -> frozenset[str]:
+        """Множество имен задач-зависимостей.
+
+        Вычисляется один раз из depends_on и кэшируется на экземпляре,
+        поэтому подходит для частых проверок принадлежности (O(1) вместо
+        поиска по списку). Предполагается, что depends_on не меняется
+        после создания задачи. Имена интернируются, как и ключи TaskRegistry.
+
+        Returns:
+            frozenset имен задач-зависимостей
+        """
+        return frozenset(map(sys.intern, self.depends_on))
+
     @abstractmethod
     def execute(self, context: ExecutionContext) -> TaskResult:
         """Выполняет задачу.
@@ -359,6 +385,9 @@ class ParameterizedIterableTask(IterableTask, Generic[TParam]):
         """Выполняет задачу с обработкой ошибок.
 
         Обрабатывает все параметры согласно error_strategy и on_error callback.
+        Агрегирует результаты того же генератора _iter_parameters, что отдает
+        execute_iter; переопределение execute_iter на execute не влияет.
+        Параметр, успешно обработанный после повторов, не попадает в ошибки.
 
         Args:
             context: Контекст выполнения задачи
@@ -372,26 +401,57 @@ class ParameterizedIterableTask(IterableTask, Generic[TParam]):
         errors: list[tuple[TParam, str]] = []
         processed = 0
 
+        for outcome in self._iter_parameters(parameters, context):
+            if outcome.success:
+                processed += 1
+            else:
+                errors.append((outcome.data, outcome.error or ""))
+
+        return self._create_result(errors, processed, len(parameters))
+
+    def execute_iter(self, context: ExecutionContext) -> Iterator[TaskResult]:
+        """Выполняет задачу, отдавая результат по каждому параметру сразу после обработки.
+
+        Позволяет потребителю обрабатывать результаты потоково, не дожидаясь
+        завершения всей задачи. Обработка ошибок такая же, как в execute:
+        при остановке (error_strategy="stop" или on_error вернул False)
+        итератор завершается после результата с ошибкой.
+
+        Args:
+            context: Контекст выполнения задачи
+
+        Returns:
+            Итератор TaskResult: для каждого параметра success_result или
+            failure_result, в data которого лежит сам параметр
+        """
+        return self._iter_parameters(self.get_parameters(context), context)
+
+    def _iter_parameters(
+        self, parameters: Iterable[TParam], context: ExecutionContext
+    ) -> Iterator[TaskResult]:
+        """Обрабатывает параметры и отдает результат по каждому из них.
+
+        Args:
+            parameters: Параметры для обработки
+            context: Контекст выполнения задачи
+
+        Returns:
+            Итератор TaskResult по одному на каждый обработанный параметр
+        """
         for param in parameters:
             retries = 0
-            success = False
-            param_error: tuple[TParam, str] | None = None
+            # Сообщение первой ошибки для параметра (как в отчете execute)
+            first_error: str | None = None
 
-            while retries <= self.max_retries and not success:
+            while True:
+                # В try только сам вызов: исключение, брошенное в генератор
+                # на yield успешного результата, не должно считаться ошибкой
+                # параметра и запускать on_error или повтор
                 try:
                     self.execute_for_parameter(param, context)
-                    success = True
-                    processed += 1
-                    # Если успешно после повтора, не добавляем ошибку
-                    if param_error:
-                        errors.remove(param_error)
-                        param_error = None
                 except Exception as e:
-                    error_msg = str(e)
-                    param_error = (param, error_msg)
-                    # Добавляем ошибку только при первой попытке
-                    if retries == 0:
-                        errors.append(param_error)
+                    if first_error is None:
+                        first_error = str(e)
 
                     # Вызываем on_error callback
                     should_continue = self.on_error(param, e, context)
@@ -400,29 +460,45 @@ class ParameterizedIterableTask(IterableTask, Generic[TParam]):
                     if should_continue is not None:
                         if not should_continue:
                             # Остановить выполнение для всех параметров
-                            return self._create_result(errors, processed, len(parameters))
+                            yield self._param_failure(param, first_error)
+                            return
                         # Продолжить выполнение
                         if self.error_strategy == "retry" and retries < self.max_retries:
                             retries += 1
                             continue
                         # Продолжить для следующего параметра
+                        yield self._param_failure(param, first_error)
                         break
 
                     # Используем error_strategy
                     if self.error_strategy == "stop":
                         # Остановить выполнение для всех параметров
-                        return self._create_result(errors, processed, len(parameters))
-                    elif self.error_strategy == "continue":
-                        # Продолжить для следующего параметра
-                        break
-                    elif self.error_strategy == "retry":
-                        if retries < self.max_retries:
-                            retries += 1
-                            continue
-                        # Исчерпаны попытки, продолжаем для следующего параметра
-                        break
+                        yield self._param_failure(param, first_error)
+                        return
+                    if self.error_strategy == "retry" and retries < self.max_retries:
+                        retries += 1
+                        continue
+                    # "continue" или исчерпаны попытки: переходим к следующему параметру
+                    yield self._param_failure(param, first_error)
+                    break
+                else:
+                    yield TaskResult.success_result(data=param)
+                    break
+
+    @staticmethod
+    def _param_failure(param: TParam, error: str) -> TaskResult:
+        """Создает результат с ошибкой для одного параметра.
 
-        return self._create_result(errors, processed, len(parameters))
+        Args:
+            param: Параметр, при обработке которого произошла ошибка
+            error: Сообщение об ошибке
+
+        Returns:
+            TaskResult со статусом FAILED и параметром в data
+        """
+        result = TaskResult.failure_result(error=error)
+        result.data = param
+        return result
 
     def _create_result(
         self, errors: list[tuple[TParam, str]], processed: int, total: int
@@ -480,8 +556,16 @@ class ProgressTracker(ABC):
         >>> progress = TaskProgress("task1", TaskStatus.IN_PROGRESS, total_items=10, processed_items=5)
         >>> tracker.save_progress("task1", progress)
         >>> saved = tracker.get_progress("task1")
+
+    Attributes:
+        supports_persistence: Сохраняет ли трекер прогресс на самом деле.
+            Трекеры-заглушки, у которых save_progress ничего не делает,
+            выставляют False — тогда ResumeIterator не создает TaskProgress
+            при периодическом сохранении.
     """
 
+    supports_persistence: bool = True
+
     @abstractmethod
     def save_progress(
         self, task_name: str, progress: TaskProgress
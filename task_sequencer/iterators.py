@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from itertools import chain
+from operator import indexOf
 from typing import Any
 
 from task_sequencer.interfaces import ProgressTracker
@@ -56,6 +58,20 @@ class ResumeIterator:
         self._current_index = 0
         self._start_index = self._find_start_index()
 
+        # Трекер без персистентности: не тратим время на создание TaskProgress
+        if not getattr(progress_tracker, "supports_persistence", True):
+            self._save_progress = self._skip_save_progress  # type: ignore[method-assign]
+
+        # Прогресс создается здесь и заведомо корректен, поэтому используем
+        # запись без проверок, если трекер ее предоставляет. Ищем по классу,
+        # чтобы не принять за нее автоатрибут Mock
+        progress_writer = getattr(type(progress_tracker), "_progress_writer", None)
+        self._write_progress: Callable[[str, TaskProgress], None] = (
+            progress_writer(progress_tracker)
+            if progress_writer is not None
+            else progress_tracker.save_progress
+        )
+
     def __iter__(self) -> Iterator[Any]:
         """Возвращает итератор, начиная с сохраненной позиции.
 
@@ -97,17 +113,20 @@ class ResumeIterator:
         if progress is None or progress.last_processed_id is None:
             return 0
 
+        # Ищем элемент с таким ID: operator.indexOf ведет цикл и сравнение
+        # в C, id_extractor по-прежнему вызывается для каждого элемента.
+        # В конец добавлен сам искомый ID, поэтому indexOf всегда находит
+        # совпадение, а ValueError из id_extractor не маскируется под
+        # "элемент не найден" и пробрасывается вызывающему
         last_id = progress.last_processed_id
+        index = indexOf(chain(map(self.id_extractor, self.items), (last_id,)), last_id)
 
-        # Ищем элемент с таким ID
-        for i, item in enumerate(self.items):
-            item_id = self.id_extractor(item)
-            if item_id == last_id:
-                # Начинаем со следующего элемента
-                return i + 1
+        if index == len(self.items):
+            # Если элемент не найден, начинаем с начала
+            return 0
 
-        # Если элемент не найден, начинаем с начала
-        return 0
+        # Начинаем со следующего элемента
+        return index + 1
 
     def _save_progress(self, index: int) -> None:
         """Сохраняет текущий прогресс обработки.
@@ -121,7 +140,8 @@ class ResumeIterator:
         item = self.items[index]
         item_id = self.id_extractor(item)
 
-        progress = TaskProgress(
+        # Значения заведомо корректны (0 <= index < len(items)), валидация не нужна
+        progress = TaskProgress._unsafe_new(
             task_name=self.task_name,
             status=TaskStatus.IN_PROGRESS,
             total_items=len(self.items),
@@ -129,7 +149,14 @@ class ResumeIterator:
             last_processed_id=item_id,
         )
 
-        self.progress_tracker.save_progress(self.task_name, progress)
+        self._write_progress(self.task_name, progress)
+
+    def _skip_save_progress(self, index: int) -> None:
+        """Заглушка сохранения прогресса для трекеров без персистентности.
+
+        Args:
+            index: Индекс последнего обработанного элемента (не используется)
+        """
 
 
 class LimitingIterator:
@@ -3,15 +3,40 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from logging import LoggerAdapter
 
 # Логгер для task-sequencer
 _logger = logging.getLogger("task_sequencer")
 
+# Форматтер создается один раз и переиспользуется всеми обработчиками
+_formatter = logging.Formatter("[task-sequencer] %(task)s: %(message)s", style="%")
+
+# Максимальное количество кэшируемых адаптеров: имена задач могут быть
+# динамическими (например, по параметру), и кэш не должен расти без предела
+_MAX_CACHED_ADAPTERS = 256
+
+
+@lru_cache(maxsize=_MAX_CACHED_ADAPTERS)
+def _adapter_for(task: str) -> LoggerAdapter:
+    """Создает адаптер для задачи; последние использованные адаптеры кэшируются.
+
+    Args:
+        task: Имя задачи
+
+    Returns:
+        LoggerAdapter с именем задачи в extra
+    """
+    return logging.LoggerAdapter(_logger, {"task": task})
+
 
 def get_logger(task_name: str | None = None) -> LoggerAdapter:
     """Создает логгер с префиксом для task-sequencer.
 
+    Адаптеры кэшируются по имени задачи (LRU, не более
+    _MAX_CACHED_ADAPTERS), поэтому повторные вызовы для одной задачи
+    обычно не создают новых объектов.
+
     Args:
         task_name: Имя задачи (опционально)
 
@@ -23,7 +48,7 @@ def get_logger(task_name: str | None = None) -> LoggerAdapter:
         >>> logger.info("Task started")
         # Выведет: [task-sequencer] my_task: Task started
     """
-    return logging.LoggerAdapter(_logger, {"task": task_name or "core"})
+    return _adapter_for(task_name or "core")
 
 
 def setup_logging(level: int = logging.INFO) -> None:
@@ -38,10 +63,7 @@ def setup_logging(level: int = logging.INFO) -> None:
         >>> setup_logging(logging.DEBUG)
     """
     handler = logging.StreamHandler()
-    formatter = logging.Formatter(
-        "[task-sequencer] %(task)s: %(message)s", style="%"
-    )
-    handler.setFormatter(formatter)
+    handler.setFormatter(_formatter)
     _logger.addHandler(handler)
     _logger.setLevel(level)
     _logger.propagate = False
@@ -61,3 +61,41 @@ class TaskProgress:
         if self.total_items is not None and self.processed_items > self.total_items:
             raise ValueError("processed_items cannot be greater than total_items")
 
+    @classmethod
+    def _unsafe_new(
+        cls,
+        task_name: str,
+        status: TaskStatus,
+        total_items: int | None,
+        processed_items: int,
+        last_processed_id: str | None,
+    ) -> TaskProgress:
+        """Создает TaskProgress без валидации в __post_init__.
+
+        Предназначен только для внутреннего использования там, где значения
+        заведомо корректны (например, в ResumeIterator при периодическом
+        сохранении прогресса).
+
+        Args:
+            task_name: Уникальное имя задачи
+            status: Текущий статус выполнения задачи
+            total_items: Общее количество элементов для обработки
+            processed_items: Количество обработанных элементов
+            last_processed_id: Идентификатор последнего обработанного элемента
+
+        Returns:
+            TaskProgress с указанными значениями
+        """
+        progress = object.__new__(cls)
+        progress.__dict__.update(
+            task_name=task_name,
+            status=status,
+            total_items=total_items,
+            processed_items=processed_items,
+            last_processed_id=last_processed_id,
+            started_at=None,
+            completed_at=None,
+            error_message=None,
+            metadata={},
+        )
+        return progress
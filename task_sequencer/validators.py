@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import sys
+import weakref
+from array import array
+from collections import deque
+from operator import itemgetter
+from typing import TYPE_CHECKING, Iterable, Iterator, NoReturn
 
 from task_sequencer.exceptions import DependencyError
 
 if TYPE_CHECKING:
     from task_sequencer.core import TaskRegistry
 
+# Максимальное количество запомненных корректных task_order на один реестр
+_MAX_CACHED_ORDERS = 128
+
 
 class DependencyValidator:
     """Валидатор зависимостей между задачами.
@@ -19,6 +27,20 @@ class DependencyValidator:
     - Отсутствие циклических зависимостей
     - Порядок задач соответствует зависимостям
 
+    Корректно упорядоченный task_order ацикличен по построению: если каждая
+    зависимость стоит раньше зависимой задачи, цикл невозможен. Поэтому поиск
+    циклов (DFS) запускается только при нарушении порядка.
+
+    Успешные проверки запоминаются по (task_order, версия реестра), поэтому
+    повторная валидация того же порядка для неизменного реестра почти
+    бесплатна. Предполагается, что depends_on задач не меняется после
+    регистрации.
+
+    Имена задач интернируются (sys.intern) в начале validate, как и ключи
+    TaskRegistry, поэтому поиск по словарям в горячих циклах проходит по
+    быстрому пути сравнения по identity. Вызывающий код может интернировать
+    имена заранее.
+
     Пример использования:
         >>> from task_sequencer import TaskRegistry, DependencyValidator
         >>> from task_sequencer.interfaces import Task, TaskResult, ExecutionContext
@@ -49,6 +71,19 @@ class DependencyValidator:
         >>> validator.validate(["task2", "task1"], registry)  # Raises DependencyError
     """
 
+    __slots__ = ("_cache", "_orders")
+
+    def __init__(self) -> None:
+        """Инициализирует валидатор."""
+        # Реестр -> (версия реестра, уже проверенные task_order)
+        self._cache: weakref.WeakKeyDictionary[
+            TaskRegistry, tuple[int, dict[tuple[str, ...], None]]
+        ] = weakref.WeakKeyDictionary()
+        # Реестр -> (версия реестра, построенный compute_order порядок)
+        self._orders: weakref.WeakKeyDictionary[
+            TaskRegistry, tuple[int, tuple[str, ...]]
+        ] = weakref.WeakKeyDictionary()
+
     def validate(
         self, task_order: list[str], registry: "TaskRegistry"
     ) -> None:
@@ -84,141 +119,629 @@ class DependencyValidator:
             ... except DependencyError as e:
             ...     print(f"Error: {e}")
         """
-        self._check_all_tasks_exist(task_order, registry)
-        self._check_cyclic_dependencies(task_order, registry)
-        self._check_dependencies_in_order(task_order, registry)
-
-    def _check_all_tasks_exist(
-        self, task_order: list[str], registry: "TaskRegistry"
-    ) -> None:
-        """Проверяет, что все задачи из task_order существуют в реестре.
-
-        Args:
-            task_order: Список имен задач
-            registry: Реестр задач
-
-        Raises:
-            DependencyError: Если какая-то задача не найдена в реестре
-        """
-        missing_tasks = []
+        if not task_order:
+            return
+
+        cache_key = tuple(task_order)
+        version = registry._version
+        cached = self._cache.get(registry)
+        if cached is not None and cached[0] == version and cache_key in cached[1]:
+            return
+
+        task_order = [sys.intern(task_name) for task_name in task_order]
+
+        # Проверка существования задач без исключений в цикле; сообщение
+        # об ошибке формируется только если отсутствующие задачи найдены
+        # Явный цикл вместо comprehension: иначе registry попадает в замыкание
+        # и все обращения к нему в validate идут через LOAD_DEREF
+        missing_tasks: list[str] = []
         for task_name in task_order:
-            try:
-                registry.get(task_name)
-            except KeyError:
+            if task_name not in registry:
                 missing_tasks.append(task_name)
-
         if missing_tasks:
             tasks_str = ", ".join(f"'{t}'" for t in missing_tasks)
             raise DependencyError(
                 f"Tasks not found in registry: {tasks_str}"
             )
 
-    def _check_dependencies_in_order(
-        self, task_order: list[str], registry: "TaskRegistry"
-    ) -> None:
-        """Проверяет, что все зависимости присутствуют в task_order и порядок корректен.
-
-        Args:
-            task_order: Список имен задач в порядке выполнения
-            registry: Реестр задач
-
-        Raises:
-            DependencyError: Если зависимость отсутствует в task_order или порядок нарушен
-        """
-        task_order_set = set(task_order)
+        # Один проход по task_order: наличие зависимостей в task_order и
+        # порядок. task_positions служит единой структурой для проверки
+        # принадлежности (O(1)) во всех проверках
         task_positions = {task_name: i for i, task_name in enumerate(task_order)}
+        order_errors: list[str] = []
+        # id задач, у которых есть зависимость, стоящая не раньше них
+        backward_sources: list[int] = []
 
         for task_name in task_order:
-            task = registry.get(task_name)
-            dependencies = task.depends_on
-
-            # Проверяем, что все зависимости присутствуют в task_order
-            missing_deps = [
-                dep for dep in dependencies if dep not in task_order_set
-            ]
-            if missing_deps:
-                deps_str = ", ".join(f"'{d}'" for d in missing_deps)
-                raise DependencyError(
-                    f"Task '{task_name}' depends on tasks not in task_order: {deps_str}"
-                )
-
-            # Проверяем, что все зависимости выполняются раньше
+            dependencies = registry.deps_of(task_name)
+            # В разреженных графах большинство задач без зависимостей:
+            # для них не создаются списки ошибок
+            if not dependencies:
+                continue
             task_position = task_positions[task_name]
-            invalid_order_deps = []
+            missing_deps: list[str] = []
+            invalid_order_deps: list[str] = []
+
             for dep in dependencies:
-                dep_position = task_positions[dep]
+                dep_position = task_positions.get(dep)
+                if dep_position is None:
+                    missing_deps.append(dep)
+                    continue
                 if dep_position >= task_position:
                     invalid_order_deps.append(dep)
 
+            if missing_deps:
+                deps_str = ", ".join(f"'{d}'" for d in missing_deps)
+                order_errors.append(
+                    f"Task '{task_name}' depends on tasks not in task_order: {deps_str}"
+                )
             if invalid_order_deps:
+                backward_sources.append(task_position)
                 deps_str = ", ".join(f"'{d}'" for d in invalid_order_deps)
-                error_msg = (
+                order_errors.append(
                     f"Task '{task_name}' depends on tasks that come "
                     f"after it in task_order: {deps_str}"
                 )
-                raise DependencyError(error_msg)
+
+        # Если все ребра идут вперед по task_order, он уже является
+        # топологическим порядком и циклов нет. Граф и поиск цикла нужны только
+        # при нарушении порядка - чтобы сообщить о цикле, а не о порядке
+        if backward_sources:
+            graph = self._build_graph(task_order, task_positions, registry)
+            self._check_cyclic_dependencies(task_order, graph, backward_sources)
+
+        if order_errors:
+            raise DependencyError("; ".join(order_errors))
+
+        self._remember_valid_order(registry, version, cache_key)
+
+    def compute_order(self, registry: "TaskRegistry") -> list[str]:
+        """Строит порядок выполнения всех задач реестра (алгоритм Кана, O(V+E)).
+
+        Позволяет не составлять task_order вручную: результат всегда проходит
+        validate. При равных условиях задачи идут в порядке регистрации.
+
+        Порядок запоминается по версии реестра: повторный вызов для
+        неизменного реестра возвращает копию готового порядка, а сам порядок
+        сразу считается проверенным, поэтому validate для него не
+        перепроверяет граф.
+
+        Args:
+            registry: Реестр задач
+
+        Returns:
+            Список имен всех задач реестра, в котором зависимости идут
+            раньше зависимых задач
+
+        Raises:
+            DependencyError: Если зависимость не найдена в реестре
+                или обнаружены циклические зависимости
+
+        Пример:
+            >>> registry = TaskRegistry([Task2(), Task1()])
+            >>> validator = DependencyValidator()
+            >>> validator.compute_order(registry)
+            ['task1', 'task2']
+        """
+        version = registry._version
+        cached = self._orders.get(registry)
+        if cached is not None and cached[0] == version:
+            return list(cached[1])
+
+        task_names = list(registry.tasks)
+        task_positions = {task_name: i for i, task_name in enumerate(task_names)}
+        # Ребра в направлении выполнения: id зависимости -> id зависимых задач
+        dependents: list[list[int]] = [[] for _ in task_names]
+        in_degree = [0] * len(task_names)
+        missing_errors: list[str] = []
+
+        for task_position, task_name in enumerate(task_names):
+            missing_deps: list[str] = []
+            for dep in registry.deps_of(task_name):
+                dep_position = task_positions.get(dep)
+                if dep_position is None:
+                    missing_deps.append(dep)
+                    continue
+                dependents[dep_position].append(task_position)
+                in_degree[task_position] += 1
+            if missing_deps:
+                deps_str = ", ".join(f"'{d}'" for d in missing_deps)
+                missing_errors.append(
+                    f"Task '{task_name}' depends on tasks not found in registry: {deps_str}"
+                )
+
+        if missing_errors:
+            raise DependencyError("; ".join(missing_errors))
+
+        ready = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+        order: list[str] = []
+        while ready:
+            task_position = ready.popleft()
+            order.append(task_names[task_position])
+            for dependent in dependents[task_position]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) < len(task_names):
+            # Оставшиеся задачи лежат на циклах или зависят от них
+            graph = self._build_graph(task_names, task_positions, registry)
+            remaining = [i for i, degree in enumerate(in_degree) if degree > 0]
+            self._check_cyclic_dependencies(task_names, graph, remaining)
+
+        plan = tuple(order)
+        self._orders[registry] = (version, plan)
+        if plan:
+            self._remember_valid_order(registry, version, plan)
+        return order
+
+    def _remember_valid_order(
+        self, registry: "TaskRegistry", version: int, cache_key: tuple[str, ...]
+    ) -> None:
+        """Запоминает успешно проверенный task_order для реестра.
+
+        Args:
+            registry: Реестр задач
+            version: Версия реестра на момент проверки
+            cache_key: Проверенный task_order в виде кортежа
+        """
+        cached = self._cache.get(registry)
+        if cached is None or cached[0] != version:
+            cached = (version, {})
+            self._cache[registry] = cached
+
+        valid_orders = cached[1]
+        if len(valid_orders) >= _MAX_CACHED_ORDERS:
+            # Вытесняем самый старый порядок
+            del valid_orders[next(iter(valid_orders))]
+        valid_orders[cache_key] = None
+
+    def _build_graph(
+        self,
+        task_order: list[str],
+        task_positions: dict[str, int],
+        registry: "TaskRegistry",
+    ) -> list[list[int]]:
+        """Строит граф зависимостей на целочисленных id узлов.
+
+        id узла - позиция задачи в task_order. В граф попадают только
+        зависимости, которые есть в task_order.
+
+        Args:
+            task_order: Список имен задач
+            task_positions: Позиции задач в task_order (имя задачи -> id)
+            registry: Реестр задач
+
+        Returns:
+            Список смежности (id задачи -> id зависимостей)
+        """
+        graph: list[list[int]] = [[] for _ in task_order]
+        for task_name in task_order:
+            edges = graph[task_positions[task_name]]
+            for dep in registry.deps_of(task_name):
+                dep_position = task_positions.get(dep)
+                if dep_position is not None:
+                    edges.append(dep_position)
+        return graph
 
     def _check_cyclic_dependencies(
-        self, task_order: list[str], registry: "TaskRegistry"
+        self,
+        task_order: list[str],
+        graph: list[list[int]],
+        roots: Iterable[int] | None = None,
     ) -> None:
         """Проверяет отсутствие циклических зависимостей (DFS, O(n)).
 
+        Любой цикл содержит хотя бы одно ребро, идущее назад по task_order,
+        поэтому достаточно начинать обход с задач, у которых есть такие
+        ребра: части графа без нарушений порядка не обходятся.
+
         Args:
             task_order: Список имен задач
-            registry: Реестр задач
+            graph: Граф зависимостей (id задачи -> id зависимостей из task_order)
+            roots: id задач, с которых начинается обход (по умолчанию все)
 
         Raises:
             DependencyError: Если обнаружены циклические зависимости
         """
-        # Строим граф зависимостей
-        graph: dict[str, list[str]] = {}
-        for task_name in task_order:
-            task = registry.get(task_name)
-            # Берем только зависимости, которые есть в task_order
-            graph[task_name] = [
-                dep for dep in task.depends_on if dep in task_order
-            ]
-
-        # DFS для поиска циклов
-        visited: set[str] = set()
-        rec_stack: set[str] = set()
-
-        def has_cycle(node: str, path: list[str] | None = None) -> bool:
-            """Проверяет наличие цикла начиная с узла.
-
-            Args:
-                node: Текущий узел для проверки
-                path: Путь от корня до текущего узла
-
-            Returns:
-                True если найден цикл
-            """
-            if path is None:
-                path = []
-
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    if has_cycle(neighbor, path):
-                        return True
-                elif neighbor in rec_stack:
-                    # Найден цикл - строим путь цикла
-                    cycle_start_idx = path.index(neighbor)
-                    cycle = path[cycle_start_idx:] + [neighbor]
-                    cycle_str = " -> ".join(cycle)
-                    raise DependencyError(
-                        f"Cyclic dependency detected: {cycle_str}"
-                    )
-
-            rec_stack.remove(node)
-            path.pop()
-            return False
-
-        # Проверяем все узлы
-        for task_name in task_order:
-            if task_name not in visited:
-                has_cycle(task_name)
+        cycles = _find_cycles(graph, roots)
+        if cycles:
+            cycles_str = "; ".join(
+                " -> ".join(task_order[node] for node in cycle) for cycle in cycles
+            )
+            raise DependencyError(f"Cyclic dependency detected: {cycles_str}")
 
+
+class IncrementalDependencyValidator(DependencyValidator):
+    """Валидатор, поддерживающий топологический порядок при добавлении задач.
+
+    Вместо полной перепроверки графа при каждом добавлении задачи использует
+    онлайн-алгоритм Pearce-Kelly: при вставке ребра, нарушающего текущий
+    порядок, переупорядочивается только затронутый участок графа. Стоимость
+    добавления задачи пропорциональна этому участку, а не размеру всего графа.
+
+    Зависимость может быть добавлена позже зависимой задачи: ребро появится
+    в момент добавления зависимости. Полная валидация конкретного task_order
+    по-прежнему доступна через validate.
+
+    compute_order использует этот граф: при повторном вызове для того же
+    реестра добавляются только задачи, зарегистрированные после предыдущего
+    вызова, вместо построения порядка всех задач заново.
+
+    Пример использования:
+        >>> validator = IncrementalDependencyValidator()
+        >>> validator.add_task("task1", [])
+        >>> validator.add_task("task2", ["task1"])
+        >>> validator.order
+        ['task1', 'task2']
+        >>> validator.add_task("task0", ["task2"])
+        >>> validator.add_task("task3", ["task3"])  # Raises DependencyError
+
+    Attributes:
+        _ids: Идентификаторы задач (имя задачи -> id)
+        _names: Имена задач по id
+        _successors: Задачи, зависящие от задачи (id -> id зависимых задач)
+        _predecessors: Зависимости задачи (id -> id зависимостей)
+        _rank: Позиция задачи в текущем топологическом порядке (по id)
+        _next_rank: Позиция для следующей добавленной задачи
+        _waiting: Еще не добавленные зависимости (имя -> id ожидающих задач)
+        _registry: Слабая ссылка на реестр, с которым синхронизирован граф
+        _synced: Количество задач этого реестра, уже добавленных в граф
+    """
+
+    __slots__ = (
+        "_ids",
+        "_names",
+        "_successors",
+        "_predecessors",
+        "_rank",
+        "_next_rank",
+        "_waiting",
+        "_registry",
+        "_synced",
+    )
+
+    def __init__(self) -> None:
+        """Инициализирует инкрементальный валидатор."""
+        super().__init__()
+        self._registry: weakref.ref[TaskRegistry] | None = None
+        self._synced = 0
+        self._reset_graph()
+
+    def _reset_graph(self) -> None:
+        """Очищает граф добавленных задач."""
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._successors: list[list[int]] = []
+        self._predecessors: list[list[int]] = []
+        self._rank: list[int] = []
+        self._next_rank = 0
+        self._waiting: dict[str, list[int]] = {}
+
+    def compute_order(self, registry: "TaskRegistry") -> list[str]:
+        """Строит порядок выполнения всех задач реестра, добавляя только новые задачи.
+
+        Реестр только пополняется, поэтому при повторном вызове для того же
+        реестра через add_task добавляются лишь задачи, зарегистрированные
+        после предыдущего вызова. Для другого реестра граф строится заново,
+        а задачи, добавленные ранее вручную, отбрасываются. Порядок может
+        отличаться от порядка DependencyValidator.compute_order, но всегда
+        проходит validate и запоминается так же, по версии реестра.
+
+        Args:
+            registry: Реестр задач
+
+        Returns:
+            Список имен всех задач реестра, в котором зависимости идут
+            раньше зависимых задач
+
+        Raises:
+            DependencyError: Если зависимость не найдена в реестре
+                или обнаружены циклические зависимости
+        """
+        version = registry._version
+        cached = self._orders.get(registry)
+        if cached is not None and cached[0] == version:
+            return list(cached[1])
+
+        if self._registry is None or self._registry() is not registry:
+            self._reset_graph()
+            self._registry = weakref.ref(registry)
+            self._synced = 0
+
+        task_names = list(registry.tasks)
+        for task_name in task_names[self._synced:]:
+            # При цикле add_task откатывает задачу: следующий вызов
+            # попробует добавить ее снова
+            self.add_task(task_name, registry.deps_of(task_name))
+            self._synced += 1
+
+        if self._waiting:
+            missing: dict[int, list[str]] = {}
+            for dep, waiters in self._waiting.items():
+                for waiter in waiters:
+                    missing.setdefault(waiter, []).append(dep)
+            missing_errors: list[str] = []
+            for task_id in sorted(missing):
+                deps_str = ", ".join(f"'{d}'" for d in missing[task_id])
+                missing_errors.append(
+                    f"Task '{self._names[task_id]}' depends on tasks not found in registry: "
+                    f"{deps_str}"
+                )
+            raise DependencyError("; ".join(missing_errors))
+
+        order = self.order
+        plan = tuple(order)
+        self._orders[registry] = (version, plan)
+        if plan:
+            self._remember_valid_order(registry, version, plan)
+        return order
+
+    @property
+    def order(self) -> list[str]:
+        """Текущий топологический порядок всех добавленных задач.
+
+        Returns:
+            Список имен задач, в котором зависимости идут раньше зависимых задач
+        """
+        by_rank = sorted(range(len(self._names)), key=self._rank.__getitem__)
+        return list(map(self._names.__getitem__, by_rank))
+
+    def add_task(self, task_name: str, depends_on: Iterable[str]) -> None:
+        """Добавляет задачу и проверяет, что она не создает цикл.
+
+        Args:
+            task_name: Имя задачи
+            depends_on: Имена задач-зависимостей
+
+        Raises:
+            ValueError: Если задача с таким именем уже добавлена
+            DependencyError: Если задача создает циклическую зависимость;
+                в этом случае состояние валидатора не меняется
+        """
+        if task_name in self._ids:
+            raise ValueError(f"Task with name '{task_name}' is already added")
+
+        task_id = len(self._names)
+        self._ids[task_name] = task_id
+        self._names.append(task_name)
+        self._successors.append([])
+        self._predecessors.append([])
+        self._rank.append(self._next_rank)
+        self._next_rank += 1
+
+        # Ребра в направлении выполнения: зависимость -> зависимая задача
+        edges: list[tuple[int, int]] = []
+        waiting_for: list[str] = []
+        for dep in depends_on:
+            dep_id = self._ids.get(dep)
+            if dep_id is None:
+                waiting_for.append(dep)
+            else:
+                edges.append((dep_id, task_id))
+        waiters = self._waiting.pop(task_name, [])
+        for waiter in waiters:
+            edges.append((task_id, waiter))
+
+        inserted: list[tuple[int, int]] = []
+        try:
+            for source, target in edges:
+                self._insert_edge(source, target)
+                inserted.append((source, target))
+        except DependencyError:
+            # Откатываем добавленные ребра и саму задачу
+            for source, target in inserted:
+                self._successors[source].remove(target)
+                self._predecessors[target].remove(source)
+            if waiters:
+                self._waiting[task_name] = waiters
+            del self._ids[task_name]
+            self._names.pop()
+            self._successors.pop()
+            self._predecessors.pop()
+            self._rank.pop()
+            raise
+
+        for dep in waiting_for:
+            self._waiting.setdefault(dep, []).append(task_id)
+
+    def _insert_edge(self, source: int, target: int) -> None:
+        """Вставляет ребро source -> target, сохраняя топологический порядок.
+
+        Args:
+            source: id задачи, которая должна выполняться раньше
+            target: id задачи, которая должна выполняться позже
+
+        Raises:
+            DependencyError: Если ребро создает цикл
+        """
+        if source == target:
+            self._raise_cycle(source, [])
+
+        rank = self._rank
+        lower, upper = rank[target], rank[source]
+        if lower > upper:
+            # Порядок уже соблюден
+            self._successors[source].append(target)
+            self._predecessors[target].append(source)
+            return
+
+        # Прямой обход от target по задачам с позицией <= upper
+        forward_parents: dict[int, int] = {target: target}
+        stack = [target]
+        while stack:
+            node = stack.pop()
+            for successor in self._successors[node]:
+                if successor == source:
+                    # Путь target -> ... -> node -> source замыкается новым ребром
+                    path = [node]
+                    while path[-1] != target:
+                        path.append(forward_parents[path[-1]])
+                    self._raise_cycle(source, path)
+                if successor not in forward_parents and rank[successor] <= upper:
+                    forward_parents[successor] = node
+                    stack.append(successor)
+
+        # Обратный обход от source по задачам с позицией >= lower
+        backward: set[int] = {source}
+        stack = [source]
+        while stack:
+            node = stack.pop()
+            for predecessor in self._predecessors[node]:
+                if predecessor not in backward and rank[predecessor] >= lower:
+                    backward.add(predecessor)
+                    stack.append(predecessor)
+
+        # Переназначаем освободившиеся позиции: сначала обратное множество, затем прямое
+        affected = sorted(backward, key=rank.__getitem__) + sorted(
+            forward_parents, key=rank.__getitem__
+        )
+        for node, new_rank in zip(affected, sorted(map(rank.__getitem__, affected))):
+            rank[node] = new_rank
+
+        self._successors[source].append(target)
+        self._predecessors[target].append(source)
+
+    def _raise_cycle(self, source: int, path: list[int]) -> NoReturn:
+        """Выбрасывает DependencyError с путем цикла в направлении зависимостей.
+
+        Args:
+            source: id задачи, от которой зависит начало пути
+            path: Путь в направлении зависимостей от source
+                (каждая задача зависит от следующей), без source
+
+        Raises:
+            DependencyError: Всегда
+        """
+        cycle = [source, *path, source]
+        cycle_str = " -> ".join(self._names[node] for node in cycle)
+        raise DependencyError(f"Cyclic dependency detected: {cycle_str}")
+
+
+def _find_cycles(
+    graph: list[list[int]], roots: Iterable[int] | None = None
+) -> list[list[int]]:
+    """Находит все циклы графа с целочисленными узлами (Tarjan SCC, O(V+E)).
+
+    Каждая сильно связная компонента из нескольких узлов (или узел с петлей)
+    содержит цикл; для каждой такой компоненты возвращается один кратчайший
+    цикл через ее узел с минимальным id. Обход итеративный, поэтому глубина
+    цепочек не ограничена лимитом рекурсии.
+
+    Если заданы roots, обходится только часть графа, достижимая из них:
+    находятся все циклы, проходящие через эту часть.
+
+    Args:
+        graph: Список смежности (id узла -> id соседей)
+        roots: id узлов, с которых начинается обход (по умолчанию все узлы)
+
+    Returns:
+        Список путей циклов в виде списков id (первый узел повторяется
+        в конце); пустой список, если циклов нет
+    """
+    n = len(graph)
+    index = array("i", [-1]) * n
+    lowlink = array("i", [0]) * n
+    on_stack = bytearray(n)
+    # Номер компоненты узла и родитель в BFS при поиске кратчайшего цикла;
+    # каждый узел входит ровно в одну компоненту, поэтому массивы общие
+    component_of = array("i", [-1]) * n
+    bfs_parent = array("i", [-1]) * n
+    scc_stack: list[int] = []
+    counter = 0
+    component_count = 0
+    cycles: list[list[int]] = []
+
+    for root in range(n) if roots is None else roots:
+        if index[root] >= 0:
+            continue
+
+        index[root] = lowlink[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack[root] = 1
+        # Стек обхода: узел и итератор по его соседям
+        work: list[tuple[int, Iterator[int]]] = [(root, iter(graph[root]))]
+
+        while work:
+            node, neighbors = work[-1]
+            neighbor = next(neighbors, None)
+
+            if neighbor is None:
+                # Все соседи узла обработаны
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+
+                if lowlink[node] == index[node]:
+                    # node - корень сильно связной компоненты
+                    component: list[int] = []
+                    component_id = component_count
+                    component_count += 1
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack[member] = 0
+                        component_of[member] = component_id
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in graph[node]:
+                        cycles.append(
+                            _shortest_cycle(
+                                graph, component, component_of, bfs_parent
+                            )
+                        )
+            elif index[neighbor] < 0:
+                index[neighbor] = lowlink[neighbor] = counter
+                counter += 1
+                scc_stack.append(neighbor)
+                on_stack[neighbor] = 1
+                work.append((neighbor, iter(graph[neighbor])))
+            elif on_stack[neighbor] and index[neighbor] < lowlink[node]:
+                lowlink[node] = index[neighbor]
+
+    cycles.sort(key=itemgetter(0))
+    return cycles
+
+
+def _shortest_cycle(
+    graph: list[list[int]],
+    component: list[int],
+    component_of: array[int],
+    bfs_parent: array[int],
+) -> list[int]:
+    """Находит кратчайший цикл внутри сильно связной компоненты (BFS).
+
+    Args:
+        graph: Список смежности (id узла -> id соседей)
+        component: Узлы сильно связной компоненты, содержащей цикл
+        component_of: Номер компоненты для каждого узла
+        bfs_parent: Родитель узла в BFS (-1 - узел еще не посещен)
+
+    Returns:
+        Путь цикла через узел компоненты с минимальным id
+        (первый узел повторяется в конце)
+    """
+    start = min(component)
+    component_id = component_of[start]
+    bfs_parent[start] = start
+    queue = deque([start])
+
+    while queue:
+        node = queue.popleft()
+        for neighbor in graph[node]:
+            if neighbor == start:
+                path = [node]
+                while path[-1] != start:
+                    path.append(bfs_parent[path[-1]])
+                path.reverse()
+                path.append(start)
+                return path
+            if component_of[neighbor] == component_id and bfs_parent[neighbor] < 0:
+                bfs_parent[neighbor] = node
+                queue.append(neighbor)
+
+    # Недостижимо: в сильно связной компоненте с циклом путь к start всегда есть
+    raise AssertionError("component does not contain a cycle")
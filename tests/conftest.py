@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
-from unittest.mock import MagicMock, Mock
+import importlib
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+from unittest.mock import Mock
 
 import pytest
 
 # Импорты будут добавляться по мере реализации модулей
+import task_sequencer.adapters
+from task_sequencer.adapters.memory import MemoryProgressTracker
+from task_sequencer.exceptions import (
+    DependencyError,
+    ProgressError,
+    TaskExecutionError,
+    TaskOrchestratorError,
+)
 from task_sequencer.progress import TaskProgress, TaskStatus
+from task_sequencer.validators import DependencyValidator
 
 
 @pytest.fixture
@@ -42,5 +56,327 @@ def failed_task_progress() -> TaskProgress:
     )
 
 
+@pytest.fixture(scope="session")
+def sample_progress() -> TaskProgress:
+    """Создает общий объект TaskProgress для тестов сохранения прогресса.
+
+    Объект только читается адаптерами, поэтому создается один раз на сессию.
+    """
+    return TaskProgress(
+        task_name="test_task",
+        status=TaskStatus.IN_PROGRESS,
+        processed_items=5,
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_progress_model() -> Mock:
+    """Создает mock-запись таблицы прогресса для тестов get_progress SQL-адаптеров."""
+    model = Mock(
+        spec=[
+            "task_name",
+            "status",
+            "total_items",
+            "processed_items",
+            "last_processed_id",
+            "started_at",
+            "completed_at",
+            "error_message",
+            "metadata_json",
+        ]
+    )
+    model.task_name = "test_task"
+    model.status = TaskStatus.IN_PROGRESS.value
+    model.processed_items = 5
+    for attr in (
+        "total_items",
+        "last_processed_id",
+        "started_at",
+        "completed_at",
+        "error_message",
+        "metadata_json",
+    ):
+        setattr(model, attr, None)
+    return model
+
+
+# Экземпляры исключений только читаются в проверках наследования,
+# поэтому создаются один раз на сессию
+@pytest.fixture(scope="session")
+def base_error() -> TaskOrchestratorError:
+    """Создает экземпляр TaskOrchestratorError."""
+    return TaskOrchestratorError("Test")
+
+
+@pytest.fixture(scope="session")
+def dependency_error() -> DependencyError:
+    """Создает экземпляр DependencyError."""
+    return DependencyError("Test")
+
+
+@pytest.fixture(scope="session")
+def task_execution_error() -> TaskExecutionError:
+    """Создает экземпляр TaskExecutionError."""
+    return TaskExecutionError("Test")
+
+
+@pytest.fixture(scope="session")
+def progress_error() -> ProgressError:
+    """Создает экземпляр ProgressError."""
+    return ProgressError("Test")
+
+
+@pytest.fixture(scope="session")
+def adapters_dir_entries() -> frozenset[str]:
+    """Возвращает имена файлов каталога task_sequencer/adapters (читается один раз)."""
+    return frozenset(os.listdir(task_sequencer.adapters.__path__[0]))
+
+
+@pytest.fixture(scope="session")
+def dependency_validator() -> DependencyValidator:
+    """Создает общий DependencyValidator на сессию.
+
+    Кэши валидатора привязаны к реестру слабой ссылкой и его версии,
+    поэтому между тестами с разными реестрами состояние не переносится.
+    """
+    return DependencyValidator()
+
+
+@pytest.fixture
+def memory_tracker() -> MemoryProgressTracker:
+    """Создает пустой MemoryProgressTracker для каждого теста."""
+    return MemoryProgressTracker()
+
+
+# Списки элементов только читаются итераторами, поэтому строятся один раз
+# на сессию; кортеж не дает тестам случайно изменить общий набор
+def _id_items(count: int) -> tuple[dict[str, str], ...]:
+    """Создает элементы {"id": "1"} ... {"id": str(count)}."""
+    return tuple({"id": str(i)} for i in range(1, count + 1))
+
+
+@pytest.fixture(scope="session")
+def items_3() -> tuple[dict[str, str], ...]:
+    """Возвращает 3 элемента с id от "1" до "3"."""
+    return _id_items(3)
+
+
+@pytest.fixture(scope="session")
+def items_4() -> tuple[dict[str, str], ...]:
+    """Возвращает 4 элемента с id от "1" до "4"."""
+    return _id_items(4)
+
+
+@pytest.fixture(scope="session")
+def items_10() -> tuple[dict[str, str], ...]:
+    """Возвращает 10 элементов с id от "1" до "10"."""
+    return _id_items(10)
+
+
+@pytest.fixture(scope="session")
+def items_25() -> tuple[dict[str, str], ...]:
+    """Возвращает 25 элементов с id от "1" до "25"."""
+    return _id_items(25)
+
+
 # Фикстуры для других компонентов будут добавляться по мере их реализации
 
+
+def mock_sqlalchemy_dependencies() -> tuple[Mock, Mock, Mock]:
+    """Создает mock-объекты зависимостей SQLAlchemy для тестирования.
+
+    Используются Mock со списком атрибутов вместо MagicMock: адаптерам нужен
+    фиксированный набор имен, а автосоздание дочерних mock-объектов и
+    magic-методов только тратит время.
+    """
+    # Мокаем select() чтобы он возвращал объект с where()
+    mock_select_obj = Mock()
+    mock_select_obj.where = Mock(return_value=mock_select_obj)
+
+    mock_sqlalchemy = Mock(
+        spec=["create_engine", "Column", "String", "Integer", "DateTime", "Text", "select"]
+    )
+    mock_sqlalchemy.configure_mock(
+        create_engine=Mock(),
+        Column=Mock(),
+        String=Mock(),
+        Integer=Mock(),
+        DateTime=Mock(),
+        Text=Mock(),
+        select=Mock(return_value=mock_select_obj),
+    )
+
+    mock_base = Mock(spec=["metadata"])
+    mock_base.configure_mock(metadata=Mock())
+    mock_orm = Mock(spec=["Session", "sessionmaker", "declarative_base"])
+    # В SQLAlchemy 2.0 declarative_base находится в sqlalchemy.orm
+    mock_orm.configure_mock(
+        Session=Mock(),
+        sessionmaker=Mock(),
+        declarative_base=Mock(return_value=mock_base),
+    )
+
+    return mock_sqlalchemy, mock_orm, mock_base
+
+
+def mock_pymongo_dependencies() -> tuple[Mock, Mock, Mock]:
+    """Создает mock-объекты зависимостей pymongo для тестирования."""
+    mock_pymongo = Mock(spec=["MongoClient"])
+    mock_pymongo.configure_mock(MongoClient=Mock())
+
+    return mock_pymongo, Mock(spec=["Collection"]), Mock(spec=["Database"])
+
+
+def _sqlalchemy_modules(mocks: tuple[Mock, Mock, Mock]) -> dict[str, Mock]:
+    """Сопоставляет mock-объекты SQLAlchemy именам модулей в sys.modules."""
+    mock_sqlalchemy, mock_orm, _ = mocks
+    return {"sqlalchemy": mock_sqlalchemy, "sqlalchemy.orm": mock_orm}
+
+
+def _pymongo_modules(mocks: tuple[Mock, Mock, Mock]) -> dict[str, Mock]:
+    """Сопоставляет mock-объекты pymongo именам модулей в sys.modules."""
+    mock_pymongo_module, mock_collection, mock_database = mocks
+    return {
+        "pymongo": mock_pymongo_module,
+        "pymongo.collection": mock_collection,
+        "pymongo.database": mock_database,
+    }
+
+
+@contextmanager
+def _adapters_imported(modules: dict[str, Mock], adapters: tuple[str, ...]) -> Iterator[None]:
+    """Импортирует модули адаптеров один раз с подставленными зависимостями.
+
+    Модули адаптеров связывают имена зависимостей при импорте, поэтому
+    дальше тесты работают с закэшированными модулями и не переимпортируют их.
+    Зависимости подставляются в sys.modules только на время импорта, а сами
+    модули адаптеров удаляются из sys.modules при выходе из контекста.
+
+    Args:
+        modules: Mock-объекты зависимостей по именам модулей
+        adapters: Имена модулей адаптеров для импорта
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for name, module in modules.items():
+            mp.setitem(sys.modules, name, module)
+        for adapter in adapters:
+            sys.modules.pop(adapter, None)
+            importlib.import_module(adapter)
+    try:
+        yield
+    finally:
+        for adapter in adapters:
+            sys.modules.pop(adapter, None)
+
+
+@pytest.fixture(scope="session")
+def _sa_mock_template() -> Iterator[tuple[Mock, Mock, Mock]]:
+    """Строит дерево mock-объектов SQLAlchemy и импортирует SQL-адаптеры один раз."""
+    mocks = mock_sqlalchemy_dependencies()
+    with _adapters_imported(
+        _sqlalchemy_modules(mocks),
+        ("task_sequencer.adapters.mysql", "task_sequencer.adapters.postgresql"),
+    ):
+        yield mocks
+
+
+@pytest.fixture(scope="session")
+def _pymongo_mock_template() -> Iterator[tuple[Mock, Mock, Mock]]:
+    """Строит mock-объекты pymongo и импортирует MongoDB-адаптер один раз."""
+    mocks = mock_pymongo_dependencies()
+    with _adapters_imported(_pymongo_modules(mocks), ("task_sequencer.adapters.mongodb",)):
+        yield mocks
+
+
+# Момент времени, который видят адаптеры вместо datetime.now()
+FROZEN_NOW = datetime(2024, 1, 1)
+
+
+class _FrozenDatetime(datetime):
+    """datetime, у которого now() всегда возвращает FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz: Any = None) -> datetime:  # type: ignore[override]
+        return FROZEN_NOW
+
+
+@pytest.fixture(scope="session")
+def frozen_now(
+    _sa_mock_template: tuple[Mock, Mock, Mock],
+    _pymongo_mock_template: tuple[Mock, Mock, Mock],
+) -> Iterator[datetime]:
+    """Фиксирует datetime.now() в модулях БД-адаптеров на всю сессию.
+
+    Подмена выполняется один раз для закэшированных модулей адаптеров,
+    поэтому тесты сравнивают отметки времени с известной константой.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for adapter in ("mysql", "postgresql", "mongodb"):
+            mp.setattr(f"task_sequencer.adapters.{adapter}.datetime", _FrozenDatetime)
+        yield FROZEN_NOW
+
+
+@pytest.fixture(scope="module")
+def adapter_dependencies(
+    _sa_mock_template: tuple[Mock, Mock, Mock],
+    _pymongo_mock_template: tuple[Mock, Mock, Mock],
+    frozen_now: datetime,
+) -> Iterator[None]:
+    """Подставляет mock-зависимости адаптеров в sys.modules один раз на модуль."""
+    modules = {**_sqlalchemy_modules(_sa_mock_template), **_pymongo_modules(_pymongo_mock_template)}
+    with pytest.MonkeyPatch.context() as mp:
+        for name, module in modules.items():
+            mp.setitem(sys.modules, name, module)
+        yield
+
+
+@pytest.fixture
+def sa_mocks(
+    _sa_mock_template: tuple[Mock, Mock, Mock], adapter_dependencies: None
+) -> tuple[Mock, Mock, Mock]:
+    """Возвращает mock-объекты SQLAlchemy со сброшенным состоянием.
+
+    Дерево mock-объектов переиспользуется между тестами: перед каждым тестом
+    сбрасываются история вызовов и return_value, которые настраивают тесты.
+    """
+    mock_sqlalchemy, mock_orm, _ = _sa_mock_template
+    for mock in _sa_mock_template:
+        mock.reset_mock()
+    mock_sqlalchemy.create_engine.reset_mock(return_value=True)
+    mock_orm.sessionmaker.reset_mock(return_value=True)
+
+    return _sa_mock_template
+
+
+@pytest.fixture
+def mock_pymongo(
+    _pymongo_mock_template: tuple[Mock, Mock, Mock], adapter_dependencies: None
+) -> Mock:
+    """Возвращает mock-модуль pymongo со сброшенным состоянием."""
+    mock_pymongo_module = _pymongo_mock_template[0]
+    for mock in _pymongo_mock_template:
+        mock.reset_mock()
+    mock_pymongo_module.MongoClient.reset_mock(return_value=True)
+
+    return mock_pymongo_module
+
+
+@pytest.fixture
+def pymongo_mocks(mock_pymongo: Mock) -> tuple[Mock, Mock, Mock]:
+    """Создает связанные mock-объекты клиента, базы данных и коллекции MongoDB.
+
+    Клиент и база данных поддерживают только обращение по ключу
+    (`client[db]`, `database[collection]`), поэтому вместо MagicMock
+    используется Mock(spec=dict) с явно заданным __getitem__.
+
+    Returns:
+        Кортеж (client, database, collection); client возвращается MongoClient()
+    """
+    mock_collection = Mock()
+    mock_database = Mock(spec=dict)
+    mock_database.__getitem__ = Mock(return_value=mock_collection)
+    mock_client = Mock(spec=dict)
+    mock_client.__getitem__ = Mock(return_value=mock_database)
+    mock_pymongo.MongoClient.return_value = mock_client
+
+    return mock_client, mock_database, mock_collection
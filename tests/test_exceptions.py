@@ -1,7 +1,5 @@
 """Тесты для исключений task-orchestrator."""
 
-from __future__ import annotations
-
 import pytest
 
 from task_sequencer.exceptions import (
@@ -21,10 +19,9 @@ class TestTaskOrchestratorError:
         assert str(error) == "Test error message"
         assert error.message == "Test error message"
 
-    def test_base_exception_is_exception(self) -> None:
+    def test_base_exception_is_exception(self, base_error: TaskOrchestratorError) -> None:
         """Тест проверяет, что TaskOrchestratorError наследуется от Exception."""
-        error = TaskOrchestratorError("Test")
-        assert isinstance(error, Exception)
+        assert isinstance(base_error, Exception)
 
 
 class TestDependencyError:
@@ -36,11 +33,10 @@ class TestDependencyError:
         assert str(error) == "Dependency validation failed"
         assert error.message == "Dependency validation failed"
 
-    def test_dependency_error_inheritance(self) -> None:
+    def test_dependency_error_inheritance(self, dependency_error: DependencyError) -> None:
         """Тест проверяет наследование DependencyError от TaskOrchestratorError."""
-        error = DependencyError("Test")
-        assert isinstance(error, TaskOrchestratorError)
-        assert isinstance(error, Exception)
+        assert isinstance(dependency_error, TaskOrchestratorError)
+        assert isinstance(dependency_error, Exception)
 
     def test_dependency_error_raises(self) -> None:
         """Тест проверяет, что DependencyError может быть выброшено."""
@@ -65,11 +61,12 @@ class TestTaskExecutionError:
         assert error.message == "Execution failed"
         assert error.task_name == "test_task"
 
-    def test_task_execution_error_inheritance(self) -> None:
+    def test_task_execution_error_inheritance(
+        self, task_execution_error: TaskExecutionError
+    ) -> None:
         """Тест проверяет наследование TaskExecutionError от TaskOrchestratorError."""
-        error = TaskExecutionError("Test")
-        assert isinstance(error, TaskOrchestratorError)
-        assert isinstance(error, Exception)
+        assert isinstance(task_execution_error, TaskOrchestratorError)
+        assert isinstance(task_execution_error, Exception)
 
     def test_task_execution_error_raises(self) -> None:
         """Тест проверяет, что TaskExecutionError может быть выброшено."""
@@ -86,11 +83,10 @@ class TestProgressError:
         assert str(error) == "Progress save failed"
         assert error.message == "Progress save failed"
 
-    def test_progress_error_inheritance(self) -> None:
+    def test_progress_error_inheritance(self, progress_error: ProgressError) -> None:
         """Тест проверяет наследование ProgressError от TaskOrchestratorError."""
-        error = ProgressError("Test")
-        assert isinstance(error, TaskOrchestratorError)
-        assert isinstance(error, Exception)
+        assert isinstance(progress_error, TaskOrchestratorError)
+        assert isinstance(progress_error, Exception)
 
     def test_progress_error_raises(self) -> None:
         """Тест проверяет, что ProgressError может быть выброшено."""
@@ -101,18 +97,18 @@ class TestProgressError:
 class TestExceptionHierarchy:
     """Тесты для проверки иерархии исключений."""
 
-    def test_all_exceptions_inherit_from_base(self) -> None:
-        """Тест проверяет, что все исключения наследуются от TaskOrchestratorError."""
-        assert issubclass(DependencyError, TaskOrchestratorError)
-        assert issubclass(TaskExecutionError, TaskOrchestratorError)
-        assert issubclass(ProgressError, TaskOrchestratorError)
-
-    def test_all_exceptions_inherit_from_exception(self) -> None:
-        """Тест проверяет, что все исключения наследуются от Exception."""
-        assert issubclass(TaskOrchestratorError, Exception)
-        assert issubclass(DependencyError, Exception)
-        assert issubclass(TaskExecutionError, Exception)
-        assert issubclass(ProgressError, Exception)
-
-
-
+    @pytest.mark.parametrize(
+        ("subclass", "superclass"),
+        [
+            (DependencyError, TaskOrchestratorError),
+            (TaskExecutionError, TaskOrchestratorError),
+            (ProgressError, TaskOrchestratorError),
+            (TaskOrchestratorError, Exception),
+            (DependencyError, Exception),
+            (TaskExecutionError, Exception),
+            (ProgressError, Exception),
+        ],
+    )
+    def test_exception_hierarchy(self, subclass: type, superclass: type) -> None:
+        """Тест проверяет, что исключение наследуется от ожидаемого базового класса."""
+        assert issubclass(subclass, superclass)
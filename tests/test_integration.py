@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from datetime import datetime
+from typing import Iterator
 
 import pytest
 
@@ -57,6 +59,11 @@ class FailingTask(Task):
         return TaskResult.failure_result(error=self._error_message)
 
 
+def _default_id_extractor(item: dict[str, str]) -> str:
+    """Извлекает ID элемента для ResumeIterator."""
+    return item["id"]
+
+
 class SimpleIterableTask(IterableTask):
     """Простая итеративная задача для интеграционных тестов."""
 
@@ -69,7 +76,7 @@ class SimpleIterableTask(IterableTask):
         self._name = name
         self._items = items
         self._depends_on = depends_on or []
-        self._processed_items: list[dict[str, str]] = []
+        self._processed_items: deque[dict[str, str]] = deque()
 
     @property
     def name(self) -> str:
@@ -81,27 +88,22 @@ class SimpleIterableTask(IterableTask):
 
     def execute(self, context: ExecutionContext) -> TaskResult:
         """Выполняет итеративную задачу с поддержкой resume."""
-        items = list(self.get_items(context))
+        items_iterator: Iterator[dict[str, str]] = self.get_items(context)
 
         # Используем ResumeIterator если resume=True
-        if context.metadata.get("resume", False):
-            id_extractor = context.metadata.get("id_extractor")
-            if id_extractor is None:
-                def default_id_extractor(item: dict[str, str]) -> str:
-                    return item["id"]
-                id_extractor = default_id_extractor
-
-            if context.progress_tracker:
-                items_iterator = ResumeIterator(
-                    items=items,
-                    progress_tracker=context.progress_tracker,
-                    task_name=self._name,
-                    id_extractor=id_extractor,
-                )
-            else:
-                items_iterator = iter(items)
-        else:
-            items_iterator = iter(items)
+        if context.metadata.get("resume", False) and context.progress_tracker:
+            id_extractor = (
+                context.metadata.get("id_extractor") or _default_id_extractor
+            )
+
+            # ResumeIterator нужен произвольный доступ, поэтому только здесь
+            # элементы собираются в список
+            items_iterator = ResumeIterator(
+                items=list(items_iterator),
+                progress_tracker=context.progress_tracker,
+                task_name=self._name,
+                id_extractor=id_extractor,
+            )
 
         for item in items_iterator:
             self.execute_for_item(item, context)
@@ -110,8 +112,8 @@ class SimpleIterableTask(IterableTask):
             data={"processed_items": len(self._processed_items)}
         )
 
-    def get_items(self, context: ExecutionContext) -> list[dict[str, str]]:
-        return self._items
+    def get_items(self, context: ExecutionContext) -> Iterator[dict[str, str]]:
+        return iter(self._items)
 
     def execute_for_item(self, item: dict[str, str], context: ExecutionContext) -> None:
         self._processed_items.append(item)
@@ -299,7 +301,11 @@ class TestIntegration:
         assert context_results["task1"].success is True
         assert context_results["task2"].success is True
 
-    def test_performance_dependency_validation_100_tasks(self) -> None:
+    def test_performance_dependency_validation_100_tasks(
+        self,
+        memory_tracker: MemoryProgressTracker,
+        dependency_validator: DependencyValidator,
+    ) -> None:
         """Тест производительности валидации зависимостей для 100 задач (AC-6.1)."""
         # Создаем 100 задач с линейными зависимостями
         tasks = []
@@ -309,22 +315,22 @@ class TestIntegration:
             tasks.append(task)
 
         registry = TaskRegistry(tasks)
-        tracker = MemoryProgressTracker()
-        validator = DependencyValidator()
-        orchestrator = TaskOrchestrator(registry, tracker, validator)
+        tracker = memory_tracker
+        validator = dependency_validator
+        orchestrator = TaskOrchestrator(registry, tracker, validator, max_workers=4)
 
         task_order = [f"task_{i}" for i in range(100)]
 
-        # Измеряем время валидации
-        start_time = time.time()
-        orchestrator.execute(task_order)
-        end_time = time.time()
-
-        execution_time = end_time - start_time
+        # Измеряем время выполнения, валидацию берем из замеров оркестратора
+        start_ns = time.perf_counter_ns()
+        first_result = orchestrator.execute(task_order)
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+        validation_time = first_result.metadata["phase_times_ns"]["validate"] / 1e9
 
         # AC-6.1: Валидация зависимостей для 100 задач должна выполняться менее чем за 1 секунду
-        # Но здесь мы измеряем полное выполнение, включая валидацию
-        # Валидация сама по себе должна быть быстрой
+        assert validation_time < 1.0, (
+            f"Validation took {validation_time:.2f}s, expected < 1.0s"
+        )
         assert execution_time < 2.0, f"Execution took {execution_time:.2f}s, expected < 2.0s"
 
         # Проверяем, что все задачи выполнены
@@ -332,12 +338,16 @@ class TestIntegration:
         assert result.status == TaskStatus.COMPLETED
         assert len(result.completed_tasks) == 100
 
-    def test_performance_progress_save(self) -> None:
+    def test_performance_progress_save(
+        self,
+        memory_tracker: MemoryProgressTracker,
+        dependency_validator: DependencyValidator,
+    ) -> None:
         """Тест производительности сохранения прогресса (AC-6.2)."""
         task = SimpleTask("test_task")
         registry = TaskRegistry([task])
-        tracker = MemoryProgressTracker()
-        validator = DependencyValidator()
+        tracker = memory_tracker
+        validator = dependency_validator
         # Создаем оркестратор для инициализации компонентов
         _ = TaskOrchestrator(registry, tracker, validator)
 
@@ -348,16 +358,18 @@ class TestIntegration:
             processed_items=1,
         )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         tracker.save_progress("test_task", progress)
-        end_time = time.time()
-
-        save_time = (end_time - start_time) * 1000  # в миллисекундах
+        save_time = (time.perf_counter_ns() - start_ns) / 1e6  # в миллисекундах
 
         # AC-6.2: Сохранение прогресса не должно блокировать выполнение более чем на 10ms
         assert save_time < 10, f"Save took {save_time:.2f}ms, expected < 10ms"
 
-    def test_performance_50_tasks_execution(self) -> None:
+    def test_performance_50_tasks_execution(
+        self,
+        memory_tracker: MemoryProgressTracker,
+        dependency_validator: DependencyValidator,
+    ) -> None:
         """Тест производительности выполнения 50+ задач (AC-6.3)."""
         # Создаем 50 задач
         tasks = []
@@ -366,9 +378,9 @@ class TestIntegration:
             tasks.append(task)
 
         registry = TaskRegistry(tasks)
-        tracker = MemoryProgressTracker()
-        validator = DependencyValidator()
-        orchestrator = TaskOrchestrator(registry, tracker, validator)
+        tracker = memory_tracker
+        validator = dependency_validator
+        orchestrator = TaskOrchestrator(registry, tracker, validator, max_workers=4)
 
         task_order = [f"task_{i}" for i in range(50)]
 
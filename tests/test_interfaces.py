@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
-from unittest.mock import Mock
+import sys
+from contextlib import nullcontext
+from typing import Any, ContextManager
 
 import pytest
 
@@ -14,7 +15,110 @@ from task_sequencer.interfaces import (
     Task,
     TaskResult,
 )
-from task_sequencer.progress import TaskStatus
+from task_sequencer.progress import TaskProgress, TaskStatus
+
+
+class _StubTracker(ProgressTracker):
+    """Трекер-заглушка: все методы ничего не делают."""
+
+    def save_progress(self, task_name: str, progress: TaskProgress) -> None:
+        pass
+
+    def get_progress(self, task_name: str) -> TaskProgress | None:
+        return None
+
+    def mark_completed(self, task_name: str) -> None:
+        pass
+
+    def clear_progress(self, task_name: str) -> None:
+        pass
+
+    def transaction(self) -> ContextManager[None]:
+        return nullcontext()
+
+
+# Тесты только передают трекер в ExecutionContext и не проверяют вызовы,
+# поэтому вместо Mock(spec=ProgressTracker) используется общая заглушка
+_STUB_TRACKER = _StubTracker()
+
+# Готовые результаты для тестов, которые только читают их поля;
+# тесты конструкторов TaskResult создают собственные экземпляры
+_SUCCESS = TaskResult.success_result()
+_FAILURE = TaskResult.failure_result("Error")
+
+# Контекст для вызова методов задач, которые его не изменяют
+_TASK_CONTEXT = ExecutionContext(
+    task_order=["test_task"],
+    results={},
+    metadata={},
+    progress_tracker=_STUB_TRACKER,
+)
+
+
+# Реализации абстрактных членов Task и IterableTask для проверки того,
+# что пропуск любого из них запрещает создание экземпляра
+_TASK_MEMBERS: dict[str, Any] = {
+    "name": property(lambda self: "test_task"),
+    "depends_on": property(lambda self: []),
+    "execute": lambda self, context: _SUCCESS,
+}
+_ITERABLE_TASK_MEMBERS: dict[str, Any] = {
+    **_TASK_MEMBERS,
+    "get_items": lambda self, context: iter([]),
+    "execute_for_item": lambda self, item, context: None,
+}
+
+
+def _make_subclass(base: type, members: dict[str, Any], skip: str) -> type:
+    """Создает подкласс base со всеми членами из members, кроме skip."""
+    body = {key: value for key, value in members.items() if key != skip}
+    return type(f"Incomplete{base.__name__}", (base,), body)
+
+
+class _CompleteTask(Task):
+    """Полная реализация Task без состояния."""
+
+    @property
+    def name(self) -> str:
+        return "test_task"
+
+    @property
+    def depends_on(self) -> list[str]:
+        return []
+
+    def execute(self, context: ExecutionContext) -> TaskResult:
+        return TaskResult.success_result(data="completed")
+
+
+class _CompleteIterableTask(IterableTask):
+    """Полная реализация IterableTask без состояния."""
+
+    @property
+    def name(self) -> str:
+        return "iterable_task"
+
+    @property
+    def depends_on(self) -> list[str]:
+        return []
+
+    def execute(self, context: ExecutionContext) -> TaskResult:
+        return _SUCCESS
+
+    def get_items(self, context: ExecutionContext) -> Any:
+        return iter([1, 2, 3])
+
+    def execute_for_item(self, item: Any, context: ExecutionContext) -> None:
+        pass
+
+
+class _IncompleteProgressTracker(ProgressTracker):
+    """Неполная реализация ProgressTracker: нет части абстрактных методов."""
+
+    def save_progress(self, task_name: str, progress: Any) -> None:
+        pass
+
+    def get_progress(self, task_name: str) -> Any:
+        return None
 
 
 class TestTaskResult:
@@ -25,10 +129,12 @@ class TestTaskResult:
         result = TaskResult.success_result(data={"key": "value"})
 
         assert result.success is True
-        assert result.status == TaskStatus.COMPLETED
-        assert result.data == {"key": "value"}
-        assert result.error is None
-        assert result.metadata == {}
+        assert (result.status, result.data, result.error, result.metadata) == (
+            TaskStatus.COMPLETED,
+            {"key": "value"},
+            None,
+            {},
+        )
 
     def test_create_success_result_with_metadata(self) -> None:
         """Тест создания успешного результата с метаданными."""
@@ -44,10 +150,12 @@ class TestTaskResult:
         result = TaskResult.failure_result("Test error message")
 
         assert result.success is False
-        assert result.status == TaskStatus.FAILED
-        assert result.error == "Test error message"
-        assert result.data is None
-        assert result.metadata == {}
+        assert (result.status, result.data, result.error, result.metadata) == (
+            TaskStatus.FAILED,
+            None,
+            "Test error message",
+            {},
+        )
 
     def test_create_failure_result_with_metadata(self) -> None:
         """Тест создания результата с ошибкой и метаданными."""
@@ -93,44 +201,41 @@ class TestExecutionContext:
 
     def test_create_execution_context(self) -> None:
         """Тест создания ExecutionContext."""
-        mock_tracker = Mock(spec=ProgressTracker)
         context = ExecutionContext(
             task_order=["task1", "task2"],
             results={},
             metadata={},
-            progress_tracker=mock_tracker,
+            progress_tracker=_STUB_TRACKER,
             mode="run",
         )
 
-        assert context.task_order == ["task1", "task2"]
-        assert context.results == {}
-        assert context.metadata == {}
-        assert context.progress_tracker is mock_tracker
-        assert context.mode == "run"
+        # Трекер-заглушка не переопределяет __eq__, поэтому сравнивается по идентичности
+        assert (
+            context.task_order,
+            context.results,
+            context.metadata,
+            context.progress_tracker,
+            context.mode,
+        ) == (["task1", "task2"], {}, {}, _STUB_TRACKER, "run")
 
     def test_execution_context_default_mode(self) -> None:
         """Тест проверяет, что mode по умолчанию 'run'."""
-        mock_tracker = Mock(spec=ProgressTracker)
         context = ExecutionContext(
             task_order=["task1"],
             results={},
             metadata={},
-            progress_tracker=mock_tracker,
+            progress_tracker=_STUB_TRACKER,
         )
 
         assert context.mode == "run"
 
     def test_execution_context_with_results(self) -> None:
         """Тест создания ExecutionContext с результатами."""
-        mock_tracker = Mock(spec=ProgressTracker)
-        result1 = TaskResult.success_result()
-        result2 = TaskResult.failure_result("Error")
-
         context = ExecutionContext(
             task_order=["task1", "task2"],
-            results={"task1": result1, "task2": result2},
+            results={"task1": _SUCCESS, "task2": _FAILURE},
             metadata={"key": "value"},
-            progress_tracker=mock_tracker,
+            progress_tracker=_STUB_TRACKER,
         )
 
         assert len(context.results) == 2
@@ -146,58 +251,48 @@ class TestTaskABC:
         with pytest.raises(TypeError):
             Task()  # type: ignore[abstract]
 
-    def test_task_abc_requires_name_property(self) -> None:
-        """Тест проверяет, что подкласс Task должен реализовать name."""
-        # Создаем неполную реализацию без name
-        class IncompleteTask(Task):
-            @property
-            def depends_on(self) -> list[str]:
-                return []
-
-            def execute(self, context: ExecutionContext) -> TaskResult:
-                return TaskResult.success_result()
-
-        with pytest.raises(TypeError):
-            IncompleteTask()  # type: ignore[abstract]
+    @pytest.mark.parametrize("skip", ["name", "depends_on", "execute"])
+    def test_task_abc_requires_member(self, skip: str) -> None:
+        """Тест проверяет, что подкласс Task должен реализовать name, depends_on и execute."""
+        incomplete_task = _make_subclass(Task, _TASK_MEMBERS, skip)
 
-    def test_task_abc_requires_depends_on_property(self) -> None:
-        """Тест проверяет, что подкласс Task должен реализовать depends_on."""
-        # Создаем неполную реализацию без depends_on
-        class IncompleteTask(Task):
-            @property
-            def name(self) -> str:
-                return "test_task"
+        with pytest.raises(TypeError, match=skip):
+            incomplete_task()
 
-            def execute(self, context: ExecutionContext) -> TaskResult:
-                return TaskResult.success_result()
+    def test_complete_task_implementation(self) -> None:
+        """Тест полной реализации Task."""
+        task = _CompleteTask()
+        assert task.name == "test_task"
+        assert task.depends_on == []
+        result = task.execute(_TASK_CONTEXT)
+        assert result.success is True
+        assert result.data == "completed"
 
-        with pytest.raises(TypeError):
-            IncompleteTask()  # type: ignore[abstract]
+    def test_depends_on_set_is_cached_frozenset(self) -> None:
+        """Тест проверяет, что depends_on_set вычисляется один раз."""
+        calls = 0
 
-    def test_task_abc_requires_execute_method(self) -> None:
-        """Тест проверяет, что подкласс Task должен реализовать execute."""
-        # Создаем неполную реализацию без execute
-        class IncompleteTask(Task):
+        class CompleteTask(Task):
             @property
             def name(self) -> str:
                 return "test_task"
 
             @property
             def depends_on(self) -> list[str]:
-                return []
+                nonlocal calls
+                calls += 1
+                return ["task1", "task2"]
 
-        with pytest.raises(TypeError):
-            IncompleteTask()  # type: ignore[abstract]
+            def execute(self, context: ExecutionContext) -> TaskResult:
+                return TaskResult.success_result()
 
-    def test_complete_task_implementation(self) -> None:
-        """Тест полной реализации Task."""
-        mock_tracker = Mock(spec=ProgressTracker)
-        context = ExecutionContext(
-            task_order=["test_task"],
-            results={},
-            metadata={},
-            progress_tracker=mock_tracker,
-        )
+        task = CompleteTask()
+        assert task.depends_on_set == frozenset({"task1", "task2"})
+        assert task.depends_on_set is task.depends_on_set
+        assert calls == 1
+
+    def test_depends_on_set_interns_names(self) -> None:
+        """Тест проверяет, что имена в depends_on_set интернированы."""
 
         class CompleteTask(Task):
             @property
@@ -206,17 +301,13 @@ class TestTaskABC:
 
             @property
             def depends_on(self) -> list[str]:
-                return []
+                return ["".join(["dynamic", "_dep"])]
 
             def execute(self, context: ExecutionContext) -> TaskResult:
-                return TaskResult.success_result(data="completed")
+                return TaskResult.success_result()
 
-        task = CompleteTask()
-        assert task.name == "test_task"
-        assert task.depends_on == []
-        result = task.execute(context)
-        assert result.success is True
-        assert result.data == "completed"
+        (dep,) = CompleteTask().depends_on_set
+        assert dep is sys.intern("dynamic_dep")
 
 
 class TestIterableTaskABC:
@@ -231,83 +322,19 @@ class TestIterableTaskABC:
         """Тест проверяет, что IterableTask наследуется от Task."""
         assert issubclass(IterableTask, Task)
 
-    def test_iterable_task_requires_get_items(self) -> None:
-        """Тест проверяет, что подкласс IterableTask должен реализовать get_items."""
-        # Создаем неполную реализацию без get_items
-        class IncompleteIterableTask(IterableTask):
-            @property
-            def name(self) -> str:
-                return "test_task"
+    @pytest.mark.parametrize("skip", ["get_items", "execute_for_item"])
+    def test_iterable_task_requires_member(self, skip: str) -> None:
+        """Тест проверяет, что подкласс IterableTask реализует get_items и execute_for_item."""
+        incomplete_task = _make_subclass(IterableTask, _ITERABLE_TASK_MEMBERS, skip)
 
-            @property
-            def depends_on(self) -> list[str]:
-                return []
-
-            def execute(self, context: ExecutionContext) -> TaskResult:
-                return TaskResult.success_result()
-
-            def execute_for_item(
-                self, item: Any, context: ExecutionContext
-            ) -> None:
-                pass
-
-        with pytest.raises(TypeError):
-            IncompleteIterableTask()  # type: ignore[abstract]
-
-    def test_iterable_task_requires_execute_for_item(self) -> None:
-        """Тест проверяет, что подкласс IterableTask должен реализовать execute_for_item."""
-        # Создаем неполную реализацию без execute_for_item
-        class IncompleteIterableTask(IterableTask):
-            @property
-            def name(self) -> str:
-                return "test_task"
-
-            @property
-            def depends_on(self) -> list[str]:
-                return []
-
-            def execute(self, context: ExecutionContext) -> TaskResult:
-                return TaskResult.success_result()
-
-            def get_items(self, context: ExecutionContext) -> Any:
-                return iter([])
-
-        with pytest.raises(TypeError):
-            IncompleteIterableTask()  # type: ignore[abstract]
+        with pytest.raises(TypeError, match=skip):
+            incomplete_task()
 
     def test_complete_iterable_task_implementation(self) -> None:
         """Тест полной реализации IterableTask."""
-        mock_tracker = Mock(spec=ProgressTracker)
-        context = ExecutionContext(
-            task_order=["test_task"],
-            results={},
-            metadata={},
-            progress_tracker=mock_tracker,
-        )
-
-        class CompleteIterableTask(IterableTask):
-            @property
-            def name(self) -> str:
-                return "iterable_task"
-
-            @property
-            def depends_on(self) -> list[str]:
-                return []
-
-            def execute(self, context: ExecutionContext) -> TaskResult:
-                return TaskResult.success_result()
-
-            def get_items(self, context: ExecutionContext) -> Any:
-                return iter([1, 2, 3])
-
-            def execute_for_item(
-                self, item: Any, context: ExecutionContext
-            ) -> None:
-                pass
-
-        task = CompleteIterableTask()
+        task = _CompleteIterableTask()
         assert task.name == "iterable_task"
-        items = list(task.get_items(context))
+        items = list(task.get_items(_TASK_CONTEXT))
         assert items == [1, 2, 3]
 
 
@@ -321,14 +348,6 @@ class TestProgressTrackerABC:
 
     def test_progress_tracker_requires_all_methods(self) -> None:
         """Тест проверяет, что подкласс ProgressTracker должен реализовать все методы."""
-        # Создаем неполную реализацию
-        class IncompleteProgressTracker(ProgressTracker):
-            def save_progress(self, task_name: str, progress: Any) -> None:
-                pass
-
-            def get_progress(self, task_name: str) -> Any:
-                return None
-
         with pytest.raises(TypeError):
-            IncompleteProgressTracker()  # type: ignore[abstract]
+            _IncompleteProgressTracker()  # type: ignore[abstract]
 
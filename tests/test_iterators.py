@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from operator import itemgetter
+
 import pytest
 
 from task_sequencer.adapters.memory import MemoryProgressTracker
@@ -9,18 +11,36 @@ from task_sequencer.iterators import LimitingIterator, ResumeIterator
 from task_sequencer.progress import TaskProgress, TaskStatus
 
 
-def id_extractor(item: dict[str, str]) -> str:
-    """Извлекает ID из элемента."""
-    return item["id"]
+# Извлекает ID из элемента; itemgetter вызывается без создания
+# Python-фрейма на каждый элемент
+id_extractor = itemgetter("id")
+
+
+def _save_in_progress(tracker: MemoryProgressTracker, last_id: str) -> None:
+    """Сохраняет для test_task прогресс IN_PROGRESS с последним ID last_id.
+
+    Трекер хранит сам объект TaskProgress, а он изменяемый, поэтому
+    каждый тест получает свой экземпляр.
+    """
+    tracker.save_progress(
+        "test_task",
+        TaskProgress(
+            task_name="test_task",
+            status=TaskStatus.IN_PROGRESS,
+            last_processed_id=last_id,
+        ),
+    )
 
 
 class TestResumeIterator:
     """Тесты для ResumeIterator."""
 
-    def test_resume_from_beginning_no_progress(self) -> None:
+    def test_resume_from_beginning_no_progress(
+        self, memory_tracker: MemoryProgressTracker, items_3: tuple[dict[str, str], ...]
+    ) -> None:
         """Тест продолжения с начала, если нет сохраненного прогресса."""
-        tracker = MemoryProgressTracker()
-        items = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+        tracker = memory_tracker
+        items = list(items_3)
         # Используем функцию id_extractor
 
         iterator = ResumeIterator(
@@ -32,21 +52,17 @@ class TestResumeIterator:
 
         result = list(iterator)
         assert result == items
-        assert len(result) == 3
 
-    def test_resume_from_saved_position(self) -> None:
+    def test_resume_from_saved_position(
+        self, memory_tracker: MemoryProgressTracker, items_4: tuple[dict[str, str], ...]
+    ) -> None:
         """Тест продолжения с сохраненной позиции."""
-        tracker = MemoryProgressTracker()
-        items = [{"id": "1"}, {"id": "2"}, {"id": "3"}, {"id": "4"}]
+        tracker = memory_tracker
+        items = list(items_4)
         # Используем функцию id_extractor
 
         # Сохраняем прогресс: обработали элементы до "2"
-        progress = TaskProgress(
-            task_name="test_task",
-            status=TaskStatus.IN_PROGRESS,
-            last_processed_id="2",
-        )
-        tracker.save_progress("test_task", progress)
+        _save_in_progress(tracker, "2")
 
         iterator = ResumeIterator(
             items=items,
@@ -58,21 +74,17 @@ class TestResumeIterator:
         result = list(iterator)
         # Должны начать с элемента "3" (индекс 2)
         assert result == [{"id": "3"}, {"id": "4"}]
-        assert len(result) == 2
 
-    def test_resume_from_last_item(self) -> None:
+    def test_resume_from_last_item(
+        self, memory_tracker: MemoryProgressTracker, items_3: tuple[dict[str, str], ...]
+    ) -> None:
         """Тест продолжения с последнего элемента (все уже обработано)."""
-        tracker = MemoryProgressTracker()
-        items = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+        tracker = memory_tracker
+        items = list(items_3)
         # Используем функцию id_extractor
 
         # Сохраняем прогресс: обработали последний элемент
-        progress = TaskProgress(
-            task_name="test_task",
-            status=TaskStatus.IN_PROGRESS,
-            last_processed_id="3",
-        )
-        tracker.save_progress("test_task", progress)
+        _save_in_progress(tracker, "3")
 
         iterator = ResumeIterator(
             items=items,
@@ -84,21 +96,17 @@ class TestResumeIterator:
         result = list(iterator)
         # Должен быть пустой список (все уже обработано)
         assert result == []
-        assert len(result) == 0
 
-    def test_resume_with_nonexistent_id(self) -> None:
+    def test_resume_with_nonexistent_id(
+        self, memory_tracker: MemoryProgressTracker, items_3: tuple[dict[str, str], ...]
+    ) -> None:
         """Тест продолжения, когда сохраненный ID не найден в списке."""
-        tracker = MemoryProgressTracker()
-        items = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+        tracker = memory_tracker
+        items = list(items_3)
         # Используем функцию id_extractor
 
         # Сохраняем прогресс с несуществующим ID
-        progress = TaskProgress(
-            task_name="test_task",
-            status=TaskStatus.IN_PROGRESS,
-            last_processed_id="nonexistent",
-        )
-        tracker.save_progress("test_task", progress)
+        _save_in_progress(tracker, "nonexistent")
 
         iterator = ResumeIterator(
             items=items,
@@ -111,10 +119,31 @@ class TestResumeIterator:
         # Должны начать с начала, так как ID не найден
         assert result == items
 
-    def test_periodic_save_progress(self) -> None:
+    def test_id_extractor_value_error_propagates(
+        self, memory_tracker: MemoryProgressTracker, items_3: tuple[dict[str, str], ...]
+    ) -> None:
+        """Тест: ValueError из id_extractor не превращается в старт с начала."""
+        _save_in_progress(memory_tracker, "2")
+
+        def failing_extractor(item: dict[str, str]) -> str:
+            raise ValueError("bad item")
+
+        with pytest.raises(ValueError) as exc_info:
+            ResumeIterator(
+                items=list(items_3),
+                progress_tracker=memory_tracker,
+                task_name="test_task",
+                id_extractor=failing_extractor,
+            )
+
+        assert str(exc_info.value) == "bad item"
+
+    def test_periodic_save_progress(
+        self, memory_tracker: MemoryProgressTracker, items_25: tuple[dict[str, str], ...]
+    ) -> None:
         """Тест периодического сохранения прогресса."""
-        tracker = MemoryProgressTracker()
-        items = [{"id": str(i)} for i in range(1, 26)]  # 25 элементов
+        tracker = memory_tracker
+        items = list(items_25)
         # Используем функцию id_extractor
 
         iterator = ResumeIterator(
@@ -138,10 +167,12 @@ class TestResumeIterator:
         assert progress.last_processed_id == "25"
         assert progress.processed_items == 25
 
-    def test_save_progress_on_interval(self) -> None:
+    def test_save_progress_on_interval(
+        self, memory_tracker: MemoryProgressTracker, items_10: tuple[dict[str, str], ...]
+    ) -> None:
         """Тест проверяет, что прогресс сохраняется на заданном интервале."""
-        tracker = MemoryProgressTracker()
-        items = [{"id": str(i)} for i in range(1, 11)]
+        tracker = memory_tracker
+        items = list(items_10)
         # Используем функцию id_extractor
 
         iterator = ResumeIterator(
@@ -165,9 +196,11 @@ class TestResumeIterator:
         # Должен быть сохранен прогресс для элемента с индексом 2 (3-й элемент)
         assert progress.last_processed_id in ["3", "5"]
 
-    def test_resume_iterator_with_empty_list(self) -> None:
+    def test_resume_iterator_with_empty_list(
+        self, memory_tracker: MemoryProgressTracker
+    ) -> None:
         """Тест итератора с пустым списком."""
-        tracker = MemoryProgressTracker()
+        tracker = memory_tracker
         items: list[dict[str, str]] = []
         # Используем функцию id_extractor
 
@@ -181,34 +214,31 @@ class TestResumeIterator:
         result = list(iterator)
         assert result == []
 
-    def test_resume_iterator_invalid_save_interval(self) -> None:
+    @pytest.mark.parametrize("save_interval", [0, -1])
+    def test_resume_iterator_invalid_save_interval(
+        self,
+        save_interval: int,
+        memory_tracker: MemoryProgressTracker,
+        items_3: tuple[dict[str, str], ...],
+    ) -> None:
         """Тест проверяет, что невалидный save_interval вызывает ошибку."""
-        tracker = MemoryProgressTracker()
-        items = [{"id": "1"}]
-        # Используем функцию id_extractor
-
-        with pytest.raises(ValueError, match="save_interval must be greater than 0"):
+        with pytest.raises(ValueError) as exc_info:
             ResumeIterator(
-                items=items,
-                progress_tracker=tracker,
+                items=list(items_3),
+                progress_tracker=memory_tracker,
                 task_name="test_task",
                 id_extractor=id_extractor,
-                save_interval=0,
+                save_interval=save_interval,
             )
 
-        with pytest.raises(ValueError, match="save_interval must be greater than 0"):
-            ResumeIterator(
-                items=items,
-                progress_tracker=tracker,
-                task_name="test_task",
-                id_extractor=id_extractor,
-                save_interval=-1,
-            )
+        assert str(exc_info.value) == "save_interval must be greater than 0"
 
-    def test_resume_iterator_multiple_iterations(self) -> None:
+    def test_resume_iterator_multiple_iterations(
+        self, memory_tracker: MemoryProgressTracker, items_3: tuple[dict[str, str], ...]
+    ) -> None:
         """Тест проверяет, что итератор можно использовать несколько раз."""
-        tracker = MemoryProgressTracker()
-        items = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+        tracker = memory_tracker
+        items = list(items_3)
         # Используем функцию id_extractor
 
         iterator = ResumeIterator(
@@ -224,78 +254,90 @@ class TestResumeIterator:
 
         # Вторая итерация (должна начаться с начала, так как прогресс не изменился)
         result2 = list(iterator)
-        assert len(result2) == 3
         assert result1 == result2
 
+    def test_skip_save_progress_without_persistence(
+        self, items_3: tuple[dict[str, str], ...]
+    ) -> None:
+        """Тест проверяет, что прогресс не создается для трекера без персистентности."""
 
-class TestLimitingIterator:
-    """Тесты для LimitingIterator."""
-
-    def test_limit_items(self) -> None:
-        """Тест ограничения количества элементов."""
-        source_items = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-        source_iterator = iter(source_items)
-
-        limiting_iterator = LimitingIterator(source_iterator, limit=5)
-
-        result = list(limiting_iterator)
-        assert result == [1, 2, 3, 4, 5]
-        assert len(result) == 5
+        class NonPersistentTracker(MemoryProgressTracker):
+            supports_persistence = False
 
-    def test_limit_greater_than_items(self) -> None:
-        """Тест ограничения, когда лимит больше количества элементов."""
-        source_items = [1, 2, 3]
-        source_iterator = iter(source_items)
+        tracker = NonPersistentTracker()
+        items = list(items_3)
+        extracted: list[str] = []
 
-        limiting_iterator = LimitingIterator(source_iterator, limit=10)
+        def tracking_extractor(item: dict[str, str]) -> str:
+            extracted.append(item["id"])
+            return item["id"]
 
-        result = list(limiting_iterator)
-        assert result == [1, 2, 3]
-        assert len(result) == 3
+        iterator = ResumeIterator(
+            items=items,
+            progress_tracker=tracker,
+            task_name="test_task",
+            id_extractor=tracking_extractor,
+            save_interval=1,
+        )
 
-    def test_limit_equals_items(self) -> None:
-        """Тест ограничения, когда лимит равен количеству элементов."""
-        source_items = [1, 2, 3, 4, 5]
-        source_iterator = iter(source_items)
+        result = list(iterator)
+        assert result == items
+        assert extracted == []
+        assert tracker.get_progress("test_task") is None
 
-        limiting_iterator = LimitingIterator(source_iterator, limit=5)
+    def test_save_progress_uses_overridden_tracker_method(
+        self, items_4: tuple[dict[str, str], ...]
+    ) -> None:
+        """Тест проверяет, что переопределенный save_progress не обходится."""
+        saved: list[str] = []
 
-        result = list(limiting_iterator)
-        assert result == [1, 2, 3, 4, 5]
-        assert len(result) == 5
+        class RecordingTracker(MemoryProgressTracker):
+            def save_progress(self, task_name: str, progress: TaskProgress) -> None:
+                saved.append(progress.last_processed_id or "")
+                super().save_progress(task_name, progress)
 
-    def test_limit_one(self) -> None:
-        """Тест ограничения одним элементом."""
-        source_items = [1, 2, 3, 4, 5]
-        source_iterator = iter(source_items)
+        tracker = RecordingTracker()
+        items = list(items_4)
 
-        limiting_iterator = LimitingIterator(source_iterator, limit=1)
+        iterator = ResumeIterator(
+            items=items,
+            progress_tracker=tracker,
+            task_name="test_task",
+            id_extractor=id_extractor,
+            save_interval=2,
+        )
+        list(iterator)
 
-        result = list(limiting_iterator)
-        assert result == [1]
-        assert len(result) == 1
+        assert saved == ["2", "4"]
+        progress = tracker.get_progress("test_task")
+        assert progress is not None
+        assert progress.last_processed_id == "4"
 
-    def test_limit_with_empty_iterator(self) -> None:
-        """Тест ограничения с пустым итератором."""
-        source_items: list[int] = []
-        source_iterator = iter(source_items)
 
-        limiting_iterator = LimitingIterator(source_iterator, limit=5)
+class TestLimitingIterator:
+    """Тесты для LimitingIterator."""
 
-        result = list(limiting_iterator)
-        assert result == []
-        assert len(result) == 0
+    @pytest.mark.parametrize(
+        ("source", "limit", "expected"),
+        [
+            pytest.param([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 5, [1, 2, 3, 4, 5], id="limit_items"),
+            pytest.param([1, 2, 3], 10, [1, 2, 3], id="limit_greater_than_items"),
+            pytest.param([1, 2, 3, 4, 5], 5, [1, 2, 3, 4, 5], id="limit_equals_items"),
+            pytest.param([1, 2, 3, 4, 5], 1, [1], id="limit_one"),
+            pytest.param([], 5, [], id="empty_iterator"),
+        ],
+    )
+    def test_limit(self, source: list[int], limit: int, expected: list[int]) -> None:
+        """Тест ограничения количества элементов."""
+        assert list(LimitingIterator(iter(source), limit=limit)) == expected
 
-    def test_limit_invalid_value(self) -> None:
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_limit_invalid_value(self, limit: int) -> None:
         """Тест проверяет, что невалидный лимит вызывает ошибку."""
-        source_items = [1, 2, 3]
-        source_iterator = iter(source_items)
-
-        with pytest.raises(ValueError, match="limit must be greater than 0"):
-            LimitingIterator(source_iterator, limit=0)
+        with pytest.raises(ValueError) as exc_info:
+            LimitingIterator(iter([1, 2, 3]), limit=limit)
 
-        with pytest.raises(ValueError, match="limit must be greater than 0"):
-            LimitingIterator(source_iterator, limit=-1)
+        assert str(exc_info.value) == "limit must be greater than 0"
 
     def test_limit_multiple_iterations(self) -> None:
         """Тест проверяет, что итератор можно использовать несколько раз."""
@@ -314,10 +356,7 @@ class TestLimitingIterator:
 
     def test_limit_stop_iteration(self) -> None:
         """Тест проверяет, что StopIteration выбрасывается корректно."""
-        source_items = [1, 2, 3]
-        source_iterator = iter(source_items)
-
-        limiting_iterator = LimitingIterator(source_iterator, limit=2)
+        limiting_iterator = LimitingIterator(iter([1, 2, 3]), limit=2)
 
         result = []
         for item in limiting_iterator:
@@ -346,9 +385,7 @@ class TestLimitingIterator:
     def test_limit_reset_on_iter(self) -> None:
         """Тест проверяет, что счетчик сбрасывается при вызове __iter__."""
         source_items = [1, 2, 3, 4, 5]
-        source_iterator = iter(source_items)
-
-        limiting_iterator = LimitingIterator(source_iterator, limit=2)
+        limiting_iterator = LimitingIterator(iter(source_items), limit=2)
 
         # Первая итерация
         result1 = list(limiting_iterator)
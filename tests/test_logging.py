@@ -3,18 +3,72 @@
 from __future__ import annotations
 
 import logging
-from io import StringIO
+from typing import Iterator
 from unittest.mock import patch
 
 import pytest
 
 from task_sequencer import Task, TaskOrchestrator, TaskRegistry
 from task_sequencer.adapters import MemoryProgressTracker
-from task_sequencer.interfaces import ExecutionContext, TaskResult
-from task_sequencer.logging import get_logger, setup_logging
+from task_sequencer.interfaces import ExecutionContext, IterableTask, TaskResult
+from task_sequencer.logging import (
+    _MAX_CACHED_ADAPTERS,
+    _adapter_for,
+    get_logger,
+    setup_logging,
+)
 from task_sequencer.validators import DependencyValidator
 
 
+class LoggedTask(Task):
+    """Простая успешная задача для проверки логов оркестратора."""
+
+    @property
+    def name(self) -> str:
+        return "test_task"
+
+    @property
+    def depends_on(self) -> list[str]:
+        return []
+
+    def execute(self, context: ExecutionContext) -> TaskResult:
+        return TaskResult.success_result()
+
+
+class ItemsTask(IterableTask):
+    """Итеративная задача из трех элементов для проверки логов оркестратора."""
+
+    @property
+    def name(self) -> str:
+        return "items_task"
+
+    @property
+    def depends_on(self) -> list[str]:
+        return []
+
+    def get_items(self, context: ExecutionContext) -> Iterator[int]:
+        return iter([1, 2, 3])
+
+    def execute_for_item(self, item: int, context: ExecutionContext) -> None:
+        pass
+
+    def execute(self, context: ExecutionContext) -> TaskResult:
+        for item in self.get_items(context):
+            self.execute_for_item(item, context)
+        return TaskResult.success_result()
+
+
+@pytest.fixture(scope="module")
+def orchestrator() -> TaskOrchestrator:
+    """Создает оркестратор с одной задачей, общий для тестов модуля.
+
+    Тесты проверяют только вывод логов, поэтому прогресс, оставшийся
+    в трекере после предыдущего запуска, на них не влияет.
+    """
+    registry = TaskRegistry([LoggedTask()])
+    return TaskOrchestrator(registry, MemoryProgressTracker(), DependencyValidator())
+
+
 class TestLogging:
     """Тесты для логирования."""
 
@@ -30,80 +84,64 @@ class TestLogging:
         assert logger.logger.name == "task_sequencer"
         assert logger.extra == {"task": "core"}
 
-    def test_setup_logging(self) -> None:
-        """Тест настройки логирования."""
-        stream = StringIO()
-        handler = logging.StreamHandler(stream)
-        logger = logging.getLogger("task_sequencer")
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-
-        task_logger = get_logger("test")
-        task_logger.info("Test message")
-
-        output = stream.getvalue()
-        assert "test" in output or "Test message" in output
-
-    def test_orchestrator_logs_execution_start(self) -> None:
-        """Тест логирования начала выполнения."""
-        stream = StringIO()
-        handler = logging.StreamHandler(stream)
-        logger = logging.getLogger("task_sequencer")
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
+    def test_get_logger_is_cached(self) -> None:
+        """Тест проверяет, что адаптер для одной задачи создается один раз."""
+        assert get_logger("cached_task") is get_logger("cached_task")
+        assert get_logger() is get_logger(None)
 
-        class TestTask(Task):
-            @property
-            def name(self) -> str:
-                return "test_task"
+    def test_get_logger_cache_is_bounded(self) -> None:
+        """Тест проверяет, что кэш адаптеров не растет с числом имен задач."""
+        for i in range(_MAX_CACHED_ADAPTERS + 10):
+            get_logger(f"dynamic_task_{i}")
 
-            @property
-            def depends_on(self) -> list[str]:
-                return []
+        assert _adapter_for.cache_info().currsize <= _MAX_CACHED_ADAPTERS
 
-            def execute(self, context: ExecutionContext) -> TaskResult:
-                return TaskResult.success_result()
-
-        registry = TaskRegistry([TestTask()])
-        tracker = MemoryProgressTracker()
-        validator = DependencyValidator()
-        orchestrator = TaskOrchestrator(registry, tracker, validator)
-
-        orchestrator.execute(["test_task"])
+    def test_setup_logging(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Тест настройки логирования."""
+        task_logger = get_logger("test")
+        with caplog.at_level(logging.INFO, logger="task_sequencer"):
+            task_logger.info("Test message")
 
-        output = stream.getvalue()
-        assert "Starting execution" in output or "test_task" in output
+        assert any(r.getMessage() == "Test message" for r in caplog.records)
+        assert caplog.records[0].task == "test"  # type: ignore[attr-defined]
 
-    def test_orchestrator_logs_task_completion(self) -> None:
+    def test_orchestrator_logs_execution_start(
+        self, caplog: pytest.LogCaptureFixture, orchestrator: TaskOrchestrator
+    ) -> None:
+        """Тест логирования начала выполнения."""
+        with caplog.at_level(logging.INFO, logger="task_sequencer"):
+            orchestrator.execute(["test_task"])
+
+        assert any(
+            "Starting execution" in r.getMessage()
+            or getattr(r, "task", None) == "test_task"
+            for r in caplog.records
+        )
+
+    def test_orchestrator_logs_task_completion(
+        self, caplog: pytest.LogCaptureFixture, orchestrator: TaskOrchestrator
+    ) -> None:
         """Тест логирования завершения задачи."""
-        stream = StringIO()
-        handler = logging.StreamHandler(stream)
-        logger = logging.getLogger("task_sequencer")
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
+        with caplog.at_level(logging.INFO, logger="task_sequencer"):
+            orchestrator.execute(["test_task"])
 
-        class TestTask(Task):
-            @property
-            def name(self) -> str:
-                return "test_task"
-
-            @property
-            def depends_on(self) -> list[str]:
-                return []
-
-            def execute(self, context: ExecutionContext) -> TaskResult:
-                return TaskResult.success_result()
-
-        registry = TaskRegistry([TestTask()])
-        tracker = MemoryProgressTracker()
-        validator = DependencyValidator()
-        orchestrator = TaskOrchestrator(registry, tracker, validator)
-
-        orchestrator.execute(["test_task"])
-
-        output = stream.getvalue()
         # Проверяем, что есть логирование (может быть в разных форматах)
-        assert len(output) > 0
-
-
+        assert caplog.records
 
+    def test_orchestrator_skips_progress_lookup_when_info_disabled(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Тест: без INFO прогресс итеративной задачи не читается ради лога."""
+        tracker = MemoryProgressTracker()
+        orchestrator = TaskOrchestrator(
+            TaskRegistry([ItemsTask()]), tracker, DependencyValidator()
+        )
+
+        with caplog.at_level(logging.WARNING, logger="task_sequencer"), patch.object(
+            tracker, "get_progress", wraps=tracker.get_progress
+        ) as get_progress:
+            result = orchestrator.execute(["items_task"])
+
+        assert result.completed_tasks == ["items_task"]
+        # Единственное чтение - проверка статуса перед запуском задачи
+        get_progress.assert_called_once_with("items_task")
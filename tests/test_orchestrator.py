@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from unittest.mock import Mock
+from typing import Iterator
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -77,6 +81,11 @@ class ExceptionTask(Task):
         raise ValueError(self._exception_message)
 
 
+def _default_id_extractor(item: dict[str, str]) -> str:
+    """Извлекает ID элемента для ResumeIterator."""
+    return item["id"]
+
+
 class SimpleIterableTask(IterableTask):
     """Простая итеративная задача для тестирования."""
 
@@ -107,12 +116,10 @@ class SimpleIterableTask(IterableTask):
         
         # Используем ResumeIterator если resume=True
         if context.metadata.get("resume", False):
-            id_extractor = context.metadata.get("id_extractor")
-            if id_extractor is None:
-                # Используем функцию по умолчанию
-                def default_id_extractor(item: dict[str, str]) -> str:
-                    return item["id"]
-                id_extractor = default_id_extractor
+            # Используем функцию по умолчанию, если id_extractor не задан
+            id_extractor = (
+                context.metadata.get("id_extractor") or _default_id_extractor
+            )
             
             if context.progress_tracker:
                 items_iterator = ResumeIterator(
@@ -293,10 +300,9 @@ class TestTaskOrchestrator:
         assert progress.started_at is not None
         assert progress.completed_at is not None
 
-    def test_execute_iterable_task(self) -> None:
+    def test_execute_iterable_task(self, items_3: tuple[dict[str, str], ...]) -> None:
         """Тест выполнения итеративной задачи."""
-        items = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
-        task = SimpleIterableTask("iterable_task", items)
+        task = SimpleIterableTask("iterable_task", list(items_3))
         registry = TaskRegistry([task])
         tracker = MemoryProgressTracker()
         validator = DependencyValidator()
@@ -309,10 +315,10 @@ class TestTaskOrchestrator:
         assert result.results["iterable_task"].success is True
         assert len(task._processed_items) == 3
 
-    def test_execute_iterable_task_with_resume(self) -> None:
+    def test_execute_iterable_task_with_resume(
+        self, items_3: tuple[dict[str, str], ...]
+    ) -> None:
         """Тест выполнения итеративной задачи с восстановлением."""
-        items = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
-        
         # Сохраняем прогресс: обработали элемент "1"
         tracker = MemoryProgressTracker()
         progress = TaskProgress(
@@ -324,7 +330,7 @@ class TestTaskOrchestrator:
         tracker.save_progress("iterable_task", progress)
 
         # Создаем новый экземпляр задачи для второго запуска
-        task2 = SimpleIterableTask("iterable_task", items)
+        task2 = SimpleIterableTask("iterable_task", list(items_3))
         registry2 = TaskRegistry([task2])
         validator = DependencyValidator()
         orchestrator2 = TaskOrchestrator(registry2, tracker, validator)
@@ -349,6 +355,19 @@ class TestTaskOrchestrator:
         assert result.metadata["mode"] == "dry-run"
         assert result.metadata["resume"] is True
 
+    def test_execute_reports_phase_times(self) -> None:
+        """Тест замеров длительности фаз выполнения в metadata."""
+        registry = TaskRegistry([SimpleTask("task1")])
+        orchestrator = TaskOrchestrator(
+            registry, MemoryProgressTracker(), DependencyValidator()
+        )
+
+        result = orchestrator.execute(["task1"])
+
+        phase_times = result.metadata["phase_times_ns"]
+        assert set(phase_times) == {"validate", "execute"}
+        assert all(isinstance(t, int) and t >= 0 for t in phase_times.values())
+
     def test_execute_empty_task_order(self) -> None:
         """Тест выполнения с пустым списком задач."""
         registry = TaskRegistry()
@@ -356,11 +375,18 @@ class TestTaskOrchestrator:
         validator = DependencyValidator()
         orchestrator = TaskOrchestrator(registry, tracker, validator)
 
-        result = orchestrator.execute([])
+        with patch.object(DependencyValidator, "validate") as validate:
+            result = orchestrator.execute([], mode="dry-run")
 
         assert result.status == TaskStatus.COMPLETED
         assert len(result.completed_tasks) == 0
         assert len(result.failed_tasks) == 0
+        assert result.metadata == {
+            "mode": "dry-run",
+            "resume": False,
+            "phase_times_ns": {"validate": 0, "execute": 0},
+        }
+        validate.assert_not_called()
 
     def test_execute_mark_task_started(self) -> None:
         """Тест отметки задачи как начатой."""
@@ -430,3 +456,244 @@ class TestTaskOrchestrator:
         assert context_results["task1"].success is True
         assert context_results["task2"].success is True
 
+    def test_execute_repeated_order_validated_once(self) -> None:
+        """Тест: повторный execute того же порядка берет валидацию из кэша."""
+        tasks = [
+            SimpleTask(f"task_{i}", depends_on=[f"task_{i-1}"] if i else [])
+            for i in range(10)
+        ]
+        registry = TaskRegistry(tasks)
+        orchestrator = TaskOrchestrator(
+            registry, MemoryProgressTracker(), DependencyValidator()
+        )
+        task_order = [task.name for task in tasks]
+        orchestrator.execute(task_order)
+
+        with patch.object(registry, "deps_of", wraps=registry.deps_of) as deps_of:
+            result = orchestrator.execute(task_order)
+
+        assert result.status == TaskStatus.COMPLETED
+        deps_of.assert_not_called()
+
+    def test_execute_reads_task_name_once_per_phase(self) -> None:
+        """Тест: за запуск задачи свойство name читается не более раза на фазу."""
+        reads = 0
+
+        class CountingTask(SimpleTask):
+            @property
+            def name(self) -> str:
+                nonlocal reads
+                reads += 1
+                return self._name
+
+        registry = TaskRegistry([CountingTask("task1")])
+        orchestrator = TaskOrchestrator(
+            registry, MemoryProgressTracker(), DependencyValidator()
+        )
+        reads = 0
+
+        result = orchestrator.execute(["task1"])
+
+        assert result.status == TaskStatus.COMPLETED
+        # Фазы: подготовка (_prepare_task) и выполнение (_execute_task)
+        assert reads <= 2, (
+            f"name прочитан {reads} раз(а): ожидается не более одного чтения "
+            "в _prepare_task и одного в _execute_task"
+        )
+
+
+class RecordingTask(SimpleTask):
+    """Задача, записывающая свое имя в общий журнал выполнения."""
+
+    def __init__(
+        self, name: str, log: list[str], depends_on: list[str] | None = None
+    ) -> None:
+        super().__init__(name, depends_on)
+        self._log = log
+
+    def execute(self, context: ExecutionContext) -> TaskResult:
+        self._log.append(self._name)
+        return super().execute(context)
+
+
+class ExclusiveAccessTracker(MemoryProgressTracker):
+    """Трекер, считающий одновременные обращения из разных потоков.
+
+    Как трекеры БД, считает транзакцию состоянием экземпляра: обращение
+    другого потока внутри transaction() засчитывается как пересечение.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._guard = threading.Lock()
+        self._owner: int | None = None
+        self._depth = 0
+        self.overlaps = 0
+        self.threads: set[str] = set()
+
+    @contextmanager
+    def _access(self) -> Iterator[None]:
+        current = threading.get_ident()
+        with self._guard:
+            if self._owner not in (None, current):
+                self.overlaps += 1
+            self._owner = current
+            self._depth += 1
+            self.threads.add(threading.current_thread().name)
+        # Расширяем окно, чтобы несериализованный доступ гарантированно пересекся
+        time.sleep(0.002)
+        try:
+            yield
+        finally:
+            with self._guard:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._owner = None
+
+    def save_progress(self, task_name: str, progress: TaskProgress) -> None:
+        with self._access():
+            super().save_progress(task_name, progress)
+
+    def get_progress(self, task_name: str) -> TaskProgress | None:
+        with self._access():
+            return super().get_progress(task_name)
+
+    def mark_completed(self, task_name: str) -> None:
+        with self._access():
+            super().mark_completed(task_name)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        with self._access():
+            yield
+
+
+class TestTaskOrchestratorParallel:
+    """Тесты для параллельного выполнения задач (max_workers)."""
+
+    def test_independent_tasks_run_concurrently(self) -> None:
+        """Тест одновременного выполнения независимых задач."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BarrierTask(SimpleTask):
+            def execute(self, context: ExecutionContext) -> TaskResult:
+                # Барьер пройдет только если обе задачи выполняются одновременно
+                barrier.wait()
+                return super().execute(context)
+
+        registry = TaskRegistry([BarrierTask("task1"), BarrierTask("task2")])
+        orchestrator = TaskOrchestrator(
+            registry, MemoryProgressTracker(), DependencyValidator(), max_workers=2
+        )
+
+        result = orchestrator.execute(["task1", "task2"])
+
+        assert result.status == TaskStatus.COMPLETED
+        assert set(result.completed_tasks) == {"task1", "task2"}
+
+    def test_dependencies_respected(self) -> None:
+        """Тест запуска задачи только после всех ее зависимостей."""
+        log: list[str] = []
+        registry = TaskRegistry([
+            RecordingTask("a", log),
+            RecordingTask("b", log),
+            RecordingTask("c", log, depends_on=["a", "b"]),
+            RecordingTask("d", log, depends_on=["c"]),
+        ])
+        tracker = MemoryProgressTracker()
+        orchestrator = TaskOrchestrator(
+            registry, tracker, DependencyValidator(), max_workers=4
+        )
+
+        result = orchestrator.execute(["a", "b", "c", "d"])
+
+        assert result.status == TaskStatus.COMPLETED
+        assert set(log[:2]) == {"a", "b"}
+        assert log[2:] == ["c", "d"]
+        assert all(
+            tracker.get_progress(name).status == TaskStatus.COMPLETED  # type: ignore[union-attr]
+            for name in "abcd"
+        )
+
+    def test_failure_stops_dependents(self) -> None:
+        """Тест: после ошибки зависимые задачи не запускаются."""
+        log: list[str] = []
+        registry = TaskRegistry([
+            FailingTask("task1"),
+            RecordingTask("task2", log, depends_on=["task1"]),
+        ])
+        tracker = MemoryProgressTracker()
+        orchestrator = TaskOrchestrator(
+            registry, tracker, DependencyValidator(), max_workers=2
+        )
+
+        result = orchestrator.execute(["task1", "task2"])
+
+        assert result.status == TaskStatus.FAILED
+        assert result.failed_tasks == ["task1"]
+        assert "task2" not in result.results
+        assert log == []
+        assert tracker.get_progress("task1").status == TaskStatus.FAILED  # type: ignore[union-attr]
+
+    def test_exception_converted_to_failure(self) -> None:
+        """Тест преобразования исключения задачи в неуспешный результат."""
+        registry = TaskRegistry([ExceptionTask("task1", "Boom")])
+        orchestrator = TaskOrchestrator(
+            registry, MemoryProgressTracker(), DependencyValidator(), max_workers=2
+        )
+
+        result = orchestrator.execute(["task1"])
+
+        assert result.status == TaskStatus.FAILED
+        assert "Boom" in (result.results["task1"].error or "")
+
+    def test_dag_plan_reused_for_repeated_order(self) -> None:
+        """Тест: повторный execute не перестраивает граф, регистрация сбрасывает его."""
+        log: list[str] = []
+        registry = TaskRegistry([
+            RecordingTask("a", log),
+            RecordingTask("b", log, depends_on=["a"]),
+        ])
+        orchestrator = TaskOrchestrator(
+            registry, MemoryProgressTracker(), DependencyValidator(), max_workers=2
+        )
+        orchestrator.execute(["a", "b"])
+
+        with patch.object(registry, "deps_of", wraps=registry.deps_of) as deps_of:
+            orchestrator.execute(["a", "b"])
+        deps_of.assert_not_called()
+
+        registry.register(RecordingTask("c", log, depends_on=["b"]))
+        result = orchestrator.execute(["a", "b", "c"])
+
+        assert result.status == TaskStatus.COMPLETED
+        assert log[-3:] == ["a", "b", "c"]
+
+    def test_iterable_tasks_with_resume_serialize_tracker_access(
+        self, items_3: tuple[dict[str, str], ...]
+    ) -> None:
+        """Тест: ResumeIterator в рабочих потоках не обращается к трекеру одновременно."""
+        tracker = ExclusiveAccessTracker()
+        tracker.save_progress(
+            "task_a",
+            TaskProgress(
+                task_name="task_a",
+                status=TaskStatus.IN_PROGRESS,
+                last_processed_id="1",
+            ),
+        )
+        tasks = [
+            SimpleIterableTask(f"task_{suffix}", list(items_3)) for suffix in "abcd"
+        ]
+        orchestrator = TaskOrchestrator(
+            TaskRegistry(tasks), tracker, DependencyValidator(), max_workers=4
+        )
+
+        result = orchestrator.execute([task.name for task in tasks], resume=True)
+
+        assert result.status == TaskStatus.COMPLETED
+        assert tasks[0]._processed_items == list(items_3[1:])
+        assert all(task._processed_items == list(items_3) for task in tasks[1:])
+        # Прогресс читался и сохранялся в рабочих потоках, но без пересечений
+        assert any(name != threading.main_thread().name for name in tracker.threads)
+        assert tracker.overlaps == 0
@@ -324,6 +324,46 @@ class TestParameterizedIterableTask:
         assert task.processed == ["param1", "param2"]  # Успешно после повтора
         assert task.attempts["param1"] == 2  # Было 2 попытки
 
+    def test_error_strategy_retry_succeeds_after_several_failures(self) -> None:
+        """Тест: успех после нескольких неудачных попыток с разными ошибками - успех задачи."""
+        class FlakyTask(ParameterizedIterableTask[str]):
+            def __init__(self) -> None:
+                super().__init__(error_strategy="retry", max_retries=3)
+                self.attempts = 0
+
+            @property
+            def name(self) -> str:
+                return "flaky_task"
+
+            @property
+            def depends_on(self) -> list[str]:
+                return []
+
+            def get_parameters(self, context: ExecutionContext) -> list[str]:
+                return ["param1"]
+
+            def execute_for_parameter(
+                self, param: str, context: ExecutionContext
+            ) -> None:
+                self.attempts += 1
+                if self.attempts < 3:
+                    raise ValueError(f"Attempt {self.attempts} failed")
+
+        task = FlakyTask()
+        context = ExecutionContext(
+            task_order=["flaky_task"],
+            results={},
+            metadata={},
+            progress_tracker=None,
+            mode="run",
+        )
+
+        result = task.execute(context)
+
+        assert result.success is True
+        assert result.data == {"processed": 1, "total": 1}
+        assert task.attempts == 3
+
     def test_custom_on_error(self) -> None:
         """Тест кастомной обработки ошибок через on_error."""
         class CustomErrorTask(ParameterizedIterableTask[str]):
@@ -399,4 +439,90 @@ class TestParameterizedIterableTask:
 
             InvalidRetryTask()
 
+    def test_execute_iter_yields_per_parameter_results(self) -> None:
+        """Тест, что execute_iter отдает результат по каждому параметру."""
+
+        class ContinueTask(ParameterizedIterableTask[str]):
+            def __init__(self) -> None:
+                super().__init__(error_strategy="continue")
+
+            @property
+            def name(self) -> str:
+                return "continue_task"
+
+            @property
+            def depends_on(self) -> list[str]:
+                return []
+
+            def get_parameters(self, context: ExecutionContext) -> list[str]:
+                return ["param1", "param2", "param3"]
+
+            def execute_for_parameter(
+                self, param: str, context: ExecutionContext
+            ) -> None:
+                if param == "param2":
+                    raise ValueError(f"Error processing {param}")
+
+        task = ContinueTask()
+        context = ExecutionContext(
+            task_order=["continue_task"],
+            results={},
+            metadata={},
+            progress_tracker=None,
+            mode="run",
+        )
+
+        outcomes = list(task.execute_iter(context))
+
+        assert [outcome.data for outcome in outcomes] == ["param1", "param2", "param3"]
+        assert [outcome.success for outcome in outcomes] == [True, False, True]
+        assert outcomes[1].error == "Error processing param2"
+
+    def test_execute_iter_throw_is_not_a_parameter_failure(self) -> None:
+        """Тест, что исключение, брошенное в execute_iter, не запускает повтор параметра."""
+
+        class RetryTask(ParameterizedIterableTask[str]):
+            def __init__(self) -> None:
+                super().__init__(error_strategy="retry", max_retries=2)
+                self.calls: list[str] = []
+                self.errors: list[str] = []
+
+            @property
+            def name(self) -> str:
+                return "retry_task"
+
+            @property
+            def depends_on(self) -> list[str]:
+                return []
+
+            def get_parameters(self, context: ExecutionContext) -> list[str]:
+                return ["param1", "param2"]
+
+            def execute_for_parameter(
+                self, param: str, context: ExecutionContext
+            ) -> None:
+                self.calls.append(param)
+
+            def on_error(
+                self, param: str, error: Exception, context: ExecutionContext
+            ) -> bool | None:
+                self.errors.append(param)
+                return None
+
+        task = RetryTask()
+        context = ExecutionContext(
+            task_order=["retry_task"],
+            results={},
+            metadata={},
+            progress_tracker=None,
+            mode="run",
+        )
+
+        outcomes = task.execute_iter(context)
+        assert next(outcomes).success is True
+
+        with pytest.raises(RuntimeError, match="consumer failed"):
+            outcomes.throw(RuntimeError("consumer failed"))
 
+        assert task.calls == ["param1"]
+        assert task.errors == []
@@ -153,5 +153,20 @@ class TestTaskProgress:
         assert progress.started_at == started
         assert progress.completed_at is None
 
+    def test_unsafe_new_matches_validated_constructor(self) -> None:
+        """Тест проверяет, что _unsafe_new дает объект, равный обычному TaskProgress."""
+        progress = TaskProgress._unsafe_new(
+            task_name="test_task",
+            status=TaskStatus.IN_PROGRESS,
+            total_items=10,
+            processed_items=3,
+            last_processed_id="item_3",
+        )
 
-
+        assert progress == TaskProgress(
+            task_name="test_task",
+            status=TaskStatus.IN_PROGRESS,
+            total_items=10,
+            processed_items=3,
+            last_processed_id="item_3",
+        )
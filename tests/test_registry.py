@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from unittest.mock import Mock
 
 import pytest
@@ -311,5 +312,36 @@ class TestTaskRegistry:
         assert registry["test_task"] is task
         assert isinstance(registry.tasks, dict)
 
+    def test_register_interns_task_name(self) -> None:
+        """Тест проверяет, что имя задачи интернируется при регистрации."""
+        registry = TaskRegistry()
+        task = Mock(spec=Task)
+        task.name = "".join(["dynamic", "_task"])
+        registry.register(task)
+
+        registered_name = next(iter(registry.tasks))
+        assert registered_name is sys.intern("dynamic_task")
+
+    def test_deps_of_returns_dependencies_snapshot(self) -> None:
+        """Тест проверяет, что deps_of возвращает закэшированные зависимости задачи."""
+        registry = TaskRegistry()
+        task = Mock(spec=Task)
+        task.name = "test_task"
+        task.depends_on = ["dep1", "dep2"]
+        registry.register(task)
+
+        assert registry.deps_of("test_task") == ("dep1", "dep2")
+        assert registry.deps_of("test_task") is registry.deps_of("test_task")
+
+        with pytest.raises(KeyError, match="not found in registry"):
+            registry.deps_of("missing_task")
 
+    def test_deps_of_interns_dependency_names(self) -> None:
+        """Тест проверяет, что имена зависимостей интернируются."""
+        registry = TaskRegistry()
+        task = Mock(spec=Task)
+        task.name = "test_task"
+        task.depends_on = ["".join(["dynamic", "_dep"])]
+        registry.register(task)
 
+        assert registry.deps_of("test_task")[0] is sys.intern("dynamic_dep")
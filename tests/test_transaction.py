@@ -72,5 +72,16 @@ class TestTransaction:
         assert tracker.get_progress("task1") is not None
         assert tracker.get_progress("task2") is not None
 
+    def test_memory_tracker_transaction_propagates_exception(self) -> None:
+        """Тест: переиспользуемая транзакция не подавляет исключения."""
+        tracker = MemoryProgressTracker()
+
+        with pytest.raises(RuntimeError):
+            with tracker.transaction():
+                raise RuntimeError("boom")
 
+        # После исключения транзакция по-прежнему пригодна к использованию
+        with tracker.transaction():
+            tracker.mark_completed("task1")
 
+        assert tracker.get_progress("task1").status == TaskStatus.COMPLETED
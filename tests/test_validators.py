@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock
+import sys
+from unittest.mock import Mock, patch
 
 import pytest
 
 from task_sequencer.core import TaskRegistry
 from task_sequencer.exceptions import DependencyError
 from task_sequencer.interfaces import Task
-from task_sequencer.validators import DependencyValidator
+from task_sequencer.validators import (
+    DependencyValidator,
+    IncrementalDependencyValidator,
+    _find_cycles,
+)
 
 
 class TestDependencyValidator:
@@ -138,6 +143,30 @@ class TestDependencyValidator:
         with pytest.raises(DependencyError, match="Cyclic dependency detected"):
             validator.validate(["task_a", "task_b", "task_c"], registry)
 
+    def test_validate_reports_all_cycles(self) -> None:
+        """Тест проверяет, что все независимые циклы попадают в одно сообщение."""
+        tasks = {}
+        for name in ["task_a", "task_b", "task_c", "task_d"]:
+            task = Mock(spec=Task)
+            task.name = name
+            tasks[name] = task
+
+        tasks["task_a"].depends_on = ["task_b"]
+        tasks["task_b"].depends_on = ["task_a"]
+        tasks["task_c"].depends_on = ["task_d"]
+        tasks["task_d"].depends_on = ["task_c"]
+
+        registry = TaskRegistry(list(tasks.values()))
+        validator = DependencyValidator()
+
+        with pytest.raises(DependencyError) as exc_info:
+            validator.validate(["task_a", "task_b", "task_c", "task_d"], registry)
+
+        assert str(exc_info.value) == (
+            "Cyclic dependency detected: task_a -> task_b -> task_a; "
+            "task_c -> task_d -> task_c"
+        )
+
     def test_validate_self_dependency(self) -> None:
         """Тест проверяет обнаружение самозависимости (A -> A)."""
         task_a = Mock(spec=Task)
@@ -263,3 +292,359 @@ class TestDependencyValidator:
             ["task_a", "task_b", "task_c", "task_d", "task_e"], registry
         )
 
+    def test_validator_has_no_instance_dict(self) -> None:
+        """Тест проверяет, что валидаторы не создают __dict__ у экземпляров."""
+        assert not hasattr(DependencyValidator(), "__dict__")
+        assert not hasattr(IncrementalDependencyValidator(), "__dict__")
+
+    def test_validate_reports_all_order_errors_at_once(self) -> None:
+        """Тест проверяет, что ошибки порядка для нескольких задач собираются в одно исключение."""
+        task1 = Mock(spec=Task)
+        task1.name = "task1"
+        task1.depends_on = ["missing_dep"]
+
+        task2 = Mock(spec=Task)
+        task2.name = "task2"
+        task2.depends_on = ["task3"]
+
+        task3 = Mock(spec=Task)
+        task3.name = "task3"
+        task3.depends_on = []
+
+        registry = TaskRegistry([task1, task2, task3])
+        validator = DependencyValidator()
+
+        with pytest.raises(DependencyError) as exc_info:
+            validator.validate(["task1", "task2", "task3"], registry)
+
+        message = str(exc_info.value)
+        assert "Task 'task1' depends on tasks not in task_order: 'missing_dep'" in message
+        assert "Task 'task2' depends on tasks that come after it" in message
+
+    def test_validate_long_chain_does_not_hit_recursion_limit(self) -> None:
+        """Тест проверяет, что длинная цепочка зависимостей не упирается в лимит рекурсии."""
+        chain_length = sys.getrecursionlimit() + 100
+        tasks = []
+        for i in range(chain_length):
+            task = Mock(spec=Task)
+            task.name = f"task_{i}"
+            task.depends_on = [f"task_{i - 1}"] if i > 0 else []
+            tasks.append(task)
+
+        registry = TaskRegistry(tasks)
+        validator = DependencyValidator()
+
+        # Обратный порядок заставляет DFS пройти всю цепочку от первой задачи
+        with pytest.raises(
+            DependencyError, match="depends on tasks that come after it"
+        ):
+            validator.validate([task.name for task in reversed(tasks)], registry)
+
+    def test_validate_skips_cycle_search_for_valid_order(self) -> None:
+        """Тест проверяет, что для корректного порядка граф и поиск циклов не строятся."""
+        task1 = Mock(spec=Task)
+        task1.name = "task1"
+        task1.depends_on = []
+
+        task2 = Mock(spec=Task)
+        task2.name = "task2"
+        task2.depends_on = ["task1"]
+
+        registry = TaskRegistry([task1, task2])
+        validator = DependencyValidator()
+
+        with patch.object(
+            DependencyValidator, "_build_graph"
+        ) as build_graph, patch.object(
+            DependencyValidator, "_check_cyclic_dependencies"
+        ) as check_cycles:
+            validator.validate(["task1", "task2"], registry)
+
+        build_graph.assert_not_called()
+        check_cycles.assert_not_called()
+
+    def test_validate_caches_successful_result(self) -> None:
+        """Тест проверяет, что повторная валидация того же порядка берется из кэша."""
+        task1 = Mock(spec=Task)
+        task1.name = "task1"
+        task1.depends_on = []
+
+        registry = TaskRegistry([task1])
+        validator = DependencyValidator()
+        validator.validate(["task1"], registry)
+
+        with patch.object(registry, "deps_of", wraps=registry.deps_of) as deps_of:
+            validator.validate(["task1"], registry)
+
+        deps_of.assert_not_called()
+
+    def test_validate_cache_invalidated_on_register(self) -> None:
+        """Тест проверяет, что регистрация новой задачи сбрасывает кэш валидации."""
+        task1 = Mock(spec=Task)
+        task1.name = "task1"
+        task1.depends_on = []
+
+        registry = TaskRegistry([task1])
+        validator = DependencyValidator()
+        validator.validate(["task1"], registry)
+
+        task2 = Mock(spec=Task)
+        task2.name = "task2"
+        task2.depends_on = []
+        registry.register(task2)
+
+        with patch.object(registry, "deps_of", wraps=registry.deps_of) as deps_of:
+            validator.validate(["task1"], registry)
+
+        deps_of.assert_called_once_with("task1")
+
+    def test_validate_ignores_cycles_through_tasks_outside_order(self) -> None:
+        """Тест проверяет, что зависимости вне task_order не попадают в граф циклов."""
+        task_a = Mock(spec=Task)
+        task_a.name = "task_a"
+        task_a.depends_on = ["task_b"]
+
+        task_b = Mock(spec=Task)
+        task_b.name = "task_b"
+        task_b.depends_on = ["task_a"]
+
+        registry = TaskRegistry([task_a, task_b])
+        validator = DependencyValidator()
+
+        # task_b не входит в task_order, поэтому это ошибка отсутствующей зависимости
+        with pytest.raises(
+            DependencyError, match="depends on tasks not in task_order"
+        ):
+            validator.validate(["task_a"], registry)
+
+
+class TestFindCycles:
+    """Тесты для поиска циклов в графе с целочисленными узлами."""
+
+    def test_find_cycles_returns_empty_for_dag(self) -> None:
+        """Тест проверяет, что для ацикличного графа циклы не находятся."""
+        assert _find_cycles([[], [0], [0, 1]]) == []
+
+    def test_find_cycles_returns_cycle_path(self) -> None:
+        """Тест проверяет, что возвращается путь найденного цикла."""
+        assert _find_cycles([[1], [2], [0]]) == [[0, 1, 2, 0]]
+
+    def test_find_cycles_self_loop(self) -> None:
+        """Тест проверяет обнаружение зависимости задачи от самой себя."""
+        assert _find_cycles([[], [1]]) == [[1, 1]]
+
+    def test_find_cycles_from_roots_skips_unreachable_part(self) -> None:
+        """Тест проверяет, что обход с roots не затрагивает недостижимую часть графа."""
+        graph = [[1], [0], [3], [2]]
+        assert _find_cycles(graph, roots=[2]) == [[2, 3, 2]]
+
+    def test_find_cycles_reports_all_cycles(self) -> None:
+        """Тест проверяет, что независимые циклы находятся за один проход."""
+        graph = [[1], [0], [], [4], [3]]
+        assert _find_cycles(graph) == [[0, 1, 0], [3, 4, 3]]
+
+
+class TestIncrementalDependencyValidator:
+    """Тесты для IncrementalDependencyValidator."""
+
+    def test_add_tasks_keeps_topological_order(self) -> None:
+        """Тест проверяет, что порядок соблюдается при добавлении задач."""
+        validator = IncrementalDependencyValidator()
+        validator.add_task("task2", ["task1"])
+        validator.add_task("task3", ["task2"])
+        validator.add_task("task1", [])
+
+        assert validator.order == ["task1", "task2", "task3"]
+
+    def test_add_task_reorders_affected_tasks_only(self) -> None:
+        """Тест проверяет переупорядочивание при позднем добавлении зависимости."""
+        validator = IncrementalDependencyValidator()
+        validator.add_task("task_a", ["task_c"])
+        validator.add_task("task_b", [])
+        validator.add_task("task_c", ["task_b"])
+
+        order = validator.order
+        assert order.index("task_b") < order.index("task_c") < order.index("task_a")
+
+    def test_add_task_detects_cycle(self) -> None:
+        """Тест проверяет обнаружение цикла при добавлении задачи."""
+        validator = IncrementalDependencyValidator()
+        validator.add_task("task_a", ["task_c"])
+        validator.add_task("task_b", ["task_a"])
+
+        with pytest.raises(
+            DependencyError,
+            match="Cyclic dependency detected: task_c -> task_b -> task_a -> task_c",
+        ):
+            validator.add_task("task_c", ["task_b"])
+
+    def test_add_task_rolls_back_on_cycle(self) -> None:
+        """Тест проверяет, что задача с циклом не меняет состояние валидатора."""
+        validator = IncrementalDependencyValidator()
+        validator.add_task("task_a", ["task_b"])
+
+        with pytest.raises(DependencyError, match="Cyclic dependency detected"):
+            validator.add_task("task_b", ["task_a"])
+
+        validator.add_task("task_b", [])
+        assert validator.order == ["task_b", "task_a"]
+
+    def test_add_task_self_dependency(self) -> None:
+        """Тест проверяет обнаружение зависимости задачи от самой себя."""
+        validator = IncrementalDependencyValidator()
+
+        with pytest.raises(
+            DependencyError, match="Cyclic dependency detected: task_a -> task_a"
+        ):
+            validator.add_task("task_a", ["task_a"])
+
+    def test_add_duplicate_task(self) -> None:
+        """Тест проверяет, что повторное добавление задачи вызывает ошибку."""
+        validator = IncrementalDependencyValidator()
+        validator.add_task("task_a", [])
+
+        with pytest.raises(ValueError, match="already added"):
+            validator.add_task("task_a", [])
+
+    def test_compute_order_adds_only_new_tasks(self) -> None:
+        """Тест проверяет, что повторный compute_order добавляет только новые задачи."""
+        make_task = TestComputeOrder._make_task
+        registry = TaskRegistry(
+            [make_task("task_b", ["task_a"]), make_task("task_a", [])]
+        )
+        validator = IncrementalDependencyValidator()
+        assert validator.compute_order(registry) == ["task_a", "task_b"]
+
+        registry.register(make_task("task_c", ["task_b"]))
+        registry.register(make_task("task_0", []))
+        with patch.object(registry, "deps_of", wraps=registry.deps_of) as deps_of:
+            order = validator.compute_order(registry)
+
+        assert [call.args[0] for call in deps_of.call_args_list] == ["task_c", "task_0"]
+        assert order.index("task_a") < order.index("task_b") < order.index("task_c")
+        assert set(order) == {"task_a", "task_b", "task_c", "task_0"}
+        validator.validate(order, registry)
+
+    def test_compute_order_rebuilds_for_other_registry(self) -> None:
+        """Тест проверяет, что для другого реестра граф строится заново."""
+        make_task = TestComputeOrder._make_task
+        validator = IncrementalDependencyValidator()
+        validator.compute_order(TaskRegistry([make_task("task_a", [])]))
+
+        order = validator.compute_order(TaskRegistry([make_task("task_x", [])]))
+
+        assert order == ["task_x"]
+
+    def test_compute_order_missing_dependency(self) -> None:
+        """Тест проверяет ошибку при зависимости, отсутствующей в реестре."""
+        registry = TaskRegistry([TestComputeOrder._make_task("task_a", ["missing"])])
+
+        with pytest.raises(DependencyError) as exc_info:
+            IncrementalDependencyValidator().compute_order(registry)
+
+        assert str(exc_info.value) == (
+            "Task 'task_a' depends on tasks not found in registry: 'missing'"
+        )
+
+    def test_compute_order_cycle_raises_until_fixed(self) -> None:
+        """Тест проверяет, что задача, создающая цикл, не попадает в граф."""
+        make_task = TestComputeOrder._make_task
+        registry = TaskRegistry(
+            [make_task("task_a", ["task_b"]), make_task("task_b", ["task_a"])]
+        )
+        validator = IncrementalDependencyValidator()
+
+        for _ in range(2):
+            with pytest.raises(DependencyError, match="Cyclic dependency detected"):
+                validator.compute_order(registry)
+        assert validator.order == ["task_a"]
+
+
+class TestComputeOrder:
+    """Тесты для DependencyValidator.compute_order."""
+
+    @staticmethod
+    def _make_task(name: str, depends_on: list[str]) -> Mock:
+        """Создает mock задачи с указанными зависимостями."""
+        task = Mock(spec=Task)
+        task.name = name
+        task.depends_on = depends_on
+        return task
+
+    def test_compute_order_respects_dependencies(self) -> None:
+        """Тест проверяет, что зависимости идут раньше зависимых задач."""
+        registry = TaskRegistry(
+            [
+                self._make_task("task_d", ["task_b", "task_c"]),
+                self._make_task("task_b", ["task_a"]),
+                self._make_task("task_c", ["task_a"]),
+                self._make_task("task_a", []),
+            ]
+        )
+        validator = DependencyValidator()
+
+        order = validator.compute_order(registry)
+
+        assert order == ["task_a", "task_b", "task_c", "task_d"]
+        validator.validate(order, registry)
+
+    def test_compute_order_long_chain_does_not_hit_recursion_limit(self) -> None:
+        """Тест проверяет, что Кан обрабатывает цепочку длиннее лимита рекурсии."""
+        chain_length = sys.getrecursionlimit() + 100
+        names = [f"task_{i}" for i in range(chain_length)]
+        # Регистрация в обратном порядке: ни одна задача не стоит на своем месте
+        registry = TaskRegistry(
+            [
+                self._make_task(names[i], [names[i - 1]] if i else [])
+                for i in reversed(range(chain_length))
+            ]
+        )
+
+        assert DependencyValidator().compute_order(registry) == names
+
+    def test_compute_order_cached_per_registry_version(self) -> None:
+        """Тест проверяет, что порядок запоминается до изменения реестра."""
+        registry = TaskRegistry(
+            [self._make_task("task_b", ["task_a"]), self._make_task("task_a", [])]
+        )
+        validator = DependencyValidator()
+        order = validator.compute_order(registry)
+        order.append("mutated")
+
+        with patch.object(registry, "deps_of", wraps=registry.deps_of) as deps_of:
+            assert validator.compute_order(registry) == ["task_a", "task_b"]
+            # Построенный порядок уже считается проверенным
+            validator.validate(["task_a", "task_b"], registry)
+        deps_of.assert_not_called()
+
+        registry.register(self._make_task("task_c", ["task_b"]))
+        assert validator.compute_order(registry) == ["task_a", "task_b", "task_c"]
+
+    def test_compute_order_empty_registry(self) -> None:
+        """Тест проверяет порядок для пустого реестра."""
+        assert DependencyValidator().compute_order(TaskRegistry()) == []
+
+    def test_compute_order_missing_dependency(self) -> None:
+        """Тест проверяет ошибку при зависимости, отсутствующей в реестре."""
+        registry = TaskRegistry([self._make_task("task_a", ["missing"])])
+
+        with pytest.raises(
+            DependencyError, match="depends on tasks not found in registry: 'missing'"
+        ):
+            DependencyValidator().compute_order(registry)
+
+    def test_compute_order_cycle(self) -> None:
+        """Тест проверяет ошибку при циклических зависимостях."""
+        registry = TaskRegistry(
+            [
+                self._make_task("task_a", ["task_b"]),
+                self._make_task("task_b", ["task_a"]),
+                self._make_task("task_c", ["task_a"]),
+            ]
+        )
+
+        with pytest.raises(
+            DependencyError,
+            match="Cyclic dependency detected: task_a -> task_b -> task_a$",
+        ):
+            DependencyValidator().compute_order(registry)